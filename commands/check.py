@@ -1,5 +1,5 @@
 from utils.cache import _cache_page_data, _is_cache_valid_for_context
-from utils.scraping import retrieve_page_data
+from utils.scraping import retrieve_pages
 from utils.core import debug_print
 
 
@@ -53,6 +53,8 @@ def _merge_page_data(base, new):
 
 def cmd_check(args, state):
     # TODO add ability to run check with args like --url, --selector, --include-sidebar
+    # NO_CACHE skips every cache (page data, page HTML and link statuses)
+    force_refresh = state.get_variable("NO_CACHE")
     urls = state.get_variable("EXISTING_URLS") or []
     url = state.get_variable("URL")
     if not urls and url:
@@ -78,7 +80,7 @@ def cmd_check(args, state):
     debug_print("🔄 state.current_page_data", state.current_page_data)
 
     # Check if we have cached data that matches the current context
-    if state.current_page_data and len(urls) == 1:
+    if state.current_page_data and len(urls) == 1 and not force_refresh:
         # Verify the cached data is for the current URL/context
         cache_file = state.get_variable("CACHE_FILE")
         is_valid, reason = _is_cache_valid_for_context(state, cache_file)
@@ -97,8 +99,14 @@ def cmd_check(args, state):
 
     combined = {}
     try:
-        for u in urls:
-            data = retrieve_page_data(u, selector, include_sidebar)
+        pages = retrieve_pages(
+            urls,
+            selector,
+            include_sidebar,
+            state.get_variable("ASYNC_FETCH"),
+            force_refresh,
+        )
+        for u, data in zip(urls, pages):
             if "error" in data:
                 print(f"❌ Failed to extract data for {u}: {data['error']}")
                 continue
@@ -4,6 +4,7 @@ from data.dsm import (
     get_existing_urls,
     get_proposed_url,
     get_column_value,
+    parse_sheet,
 )
 from constants import DOMAINS
 from utils.core import debug_print
@@ -42,9 +43,11 @@ def _extract_url_and_proposed_path(state, domain, row_num):
     existing_url_header = domain.get("existing_url_col_name", "EXISTING URL")
     proposed_url_header = domain.get("proposed_url_col_name", "PROPOSED URL")
 
-    df = state.excel_data.parse(
-        sheet_name=domain.get("worksheet_name"),
-        header=domain.get("worksheet_header_row", 4),
+    df = parse_sheet(
+        state.excel_data,
+        domain.get("worksheet_name"),
+        domain.get("worksheet_header_row", 4),
+        state,
     )
 
     urls = get_existing_urls(df, row_num - df_header_row, col_name=existing_url_header)
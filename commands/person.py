@@ -7,7 +7,6 @@ the Excel files in people_reports directory for matching entries in the
 """
 
 import json
-import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from utils.people_names import get_name_before_comma, key_variants_from_name
@@ -38,6 +37,13 @@ def check_people_found_progress(results: Dict[str, Dict]) -> Tuple[int, int]:
     return found, total
 
 
+_WANTED_REPORT_COLUMNS = {"full name", "headshot string"}
+
+
+def _is_wanted_report_column(col) -> bool:
+    return str(col).lower().strip() in _WANTED_REPORT_COLUMNS
+
+
 def search_excel_files(names: List[str]) -> Dict[str, Dict]:
 
     debug_print(f"20: Starting search_excel_files for names: {names}")
@@ -79,6 +85,9 @@ def search_excel_files(names: List[str]) -> Dict[str, Dict]:
 
     debug_print(f"30: Found {len(excel_files)} Excel files to search")
 
+    # Deferred so `scan` and the CLI start without paying for pandas
+    import pandas as pd
+
     # Search each Excel file
     for excel_file in excel_files:
 
@@ -91,7 +100,10 @@ def search_excel_files(names: List[str]) -> Dict[str, Dict]:
         debug_print(f"40: Processing file: {excel_file.name}")
 
         try:
-            df = pd.read_excel(excel_file, engine="openpyxl")
+            # Only the two columns below are read; skip parsing the rest
+            df = pd.read_excel(
+                excel_file, engine="openpyxl", usecols=_is_wanted_report_column
+            )
 
             # Look for 'Full Name' and 'Headshot String' columns
             full_name_col = None
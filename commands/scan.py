@@ -9,38 +9,38 @@ clipboard when possible.
 
 from __future__ import annotations
 
-import glob
+import asyncio
+import csv
+import functools
+import io
 import os
 import re
+import string
 import sys
 import json
 import unicodedata
 import platform
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, unquote
-from typing import Iterable, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from utils.core import debug_print
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from openpyxl import Workbook, load_workbook
 import requests
+from requests.adapters import HTTPAdapter
 
 from commands.person import cmd_person
 from utils.people_names import (
     load_extracted_people_names,
-    key_variants_from_name,
+    key_variants_from_tokens,
     tokenize_name,
 )
+from utils.cache import read_json, write_json
 from utils.scraping import get_page_soup
 
-try:
-    import pandas as pd
-except ImportError:
-    print(
-        "This command requires pandas. Install with: pip install pandas",
-        file=sys.stderr,
-    )
-    raise
-
 DEFAULT_SOCKS = "socks5h://127.0.0.1:8080"  # change port if needed
 
 # Determine socks URL to use
@@ -51,6 +51,29 @@ socks_url = DEFAULT_SOCKS if use_socks else None
 
 # Create a session and control whether system proxies are used
 session = requests.Session()
+try:
+    import lxml  # noqa: F401
+
+    _HEADSHOT_PARSER = "lxml"
+except ImportError:
+    _HEADSHOT_PARSER = "html.parser"
+
+try:
+    import aiohttp
+except ImportError:  # optional; only used when ASYNC_FETCH is on
+    aiohttp = None
+
+# Headshot matching only reads <img alt/src>, so skip building the rest
+_IMG_STRAINER = SoupStrainer("img")
+
+# Headshot pages are fetched concurrently; size the pool so every worker
+# keeps its own keep-alive connection instead of reconnecting
+_HEADSHOT_FETCH_WORKERS = 8
+_HEADSHOT_DOWNLOAD_WORKERS = 6
+_HEADSHOT_ASYNC_LIMIT = 32
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
 
 if socks_url:
     # Ensure SOCKS support is installed (requests[socks]/PySocks)
@@ -83,39 +106,51 @@ else:
     print("ℹ️  Not using any proxy")
 
 PCT_PREFIX = "pct-"
-PCT_PATTERN = re.compile(r"^pct-(\d+)\.xlsx$", re.IGNORECASE)
 NAMES_FILE = "names.txt"
+# Column A indexes of PCT workbooks, keyed by file name, mtime and size; bump
+# the version whenever _normalize_cell changes so old indexes are ignored
+PCT_INDEX_CACHE_DIR = Path("migration_cache") / "pct"
+_PCT_INDEX_CACHE_VERSION = 1
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SUFFIX_RE = re.compile(r"-\d{4}$")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def _pick_latest_pct_xlsx() -> str:
-    candidates = []
-    for path in glob.glob(f"{PCT_PREFIX}*.xlsx"):
-        fname = os.path.basename(path)
-        m = PCT_PATTERN.match(fname)
-        if m:
-            try:
-                num = int(m.group(1))
-                candidates.append((num, path))
-            except ValueError:
+    best_num, best_name = -1, None
+    prefix_len = len(PCT_PREFIX)
+    with os.scandir(".") as entries:
+        for entry in entries:
+            fname = entry.name
+            # pct-<number>.xlsx; anything else in the middle is skipped
+            if not (fname.startswith(PCT_PREFIX) and fname.endswith(".xlsx")):
                 continue
-    if not candidates:
+            middle = fname[prefix_len:-5]
+            if not middle.isdecimal():
+                continue
+            num = int(middle)
+            if num > best_num:
+                best_num, best_name = num, fname
+    if best_name is None:
         raise FileNotFoundError("No pct-*.xlsx files found in current directory.")
-    candidates.sort(key=lambda t: t[0], reverse=True)
-    return candidates[0][1]
+    return best_name
 
 
 def _normalize_for_match(text: Optional[str]) -> str:
     if not text:
         return ""
+    if text.isascii():
+        # NFKD is a no-op on ASCII, so go straight to the filter
+        return _NON_ALNUM_RE.sub("", text.lower())
+    # NFKD splits accents into combining marks; anything left outside a-z0-9
+    # (marks included) is then dropped by the regex, so no ASCII round-trip
     normalized = unicodedata.normalize("NFKD", text)
-    ascii_str = normalized.encode("ascii", "ignore").decode("ascii")
-    return re.sub(r"[^a-z0-9]+", "", ascii_str.lower())
+    return _NON_ALNUM_RE.sub("", normalized.lower())
 
 
-def _is_placeholder_headshot(headshot: Optional[str]) -> bool:
-    if not headshot:
-        return False
-    needle = headshot.strip().lower()
+def _is_placeholder_headshot_norm(needle: str) -> bool:
+    """True for a placeholder headshot string (already stripped and lowercased)."""
     if not needle:
         return False
     return (
@@ -149,35 +184,110 @@ def _append_todo_items(items: Iterable[str]) -> None:
         return
 
 
-def _load_column_a_as_keys(xlsx_path: str) -> pd.Series:
-    df = pd.read_excel(xlsx_path, header=None, dtype=str, engine="openpyxl")
-    if df.shape[1] < 1:
+def _normalize_cell(s: str) -> str:
+    # remove periods, lowercase, then strip + collapse whitespace runs;
+    # split() uses the same whitespace definition as \s and is faster than
+    # a regex sub for short cells
+    s = " ".join(s.replace(".", "").lower().split())
+    # remove -#### suffixes; only worth running the regex when the dash
+    # sits where the suffix would start
+    if s[-5:-4] == "-":
+        s = _SUFFIX_RE.sub("", s)
+    return s
+
+
+def _load_column_a_as_keys(xlsx_path: str) -> Dict[str, List[int]]:
+    """Map each normalized Column A key to the 1-based Excel rows holding it.
+
+    Blank cells are dropped while streaming so they are never normalized or
+    held in memory; each key's row list comes out sorted and unique.
+    """
+    # read-only mode streams the sheet and skips styles; only Column A is read
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        value_to_rows = defaultdict(list)
+        pos = 0
+        for pos, (value,) in enumerate(
+            ws.iter_rows(min_col=1, max_col=1, values_only=True), start=1
+        ):
+            if value is None:
+                continue
+            key = _normalize_cell(str(value))
+            if key:
+                value_to_rows[key].append(pos)
+    finally:
+        wb.close()
+
+    if not pos:
         raise ValueError("Excel file has no columns.")
-    colA = df.iloc[:, 0].fillna("").astype(str)
+    return value_to_rows
+
 
-    def normalize_cell(s: str) -> str:
-        # remove periods
-        s = s.replace(".", "")
-        # normalize whitespace, lowercase
-        s = re.sub(r"\s+", " ", s.strip().lower())
-        # remove -#### suffixes
-        s = re.sub(r"-\d{4}$", "", s)
-        return s
+def _pct_index_cache_path(xlsx_path: str) -> Path:
+    stat = os.stat(xlsx_path)
+    name = (
+        f"{Path(xlsx_path).stem}-{stat.st_mtime_ns}-{stat.st_size}"
+        f"-v{_PCT_INDEX_CACHE_VERSION}.json"
+    )
+    return PCT_INDEX_CACHE_DIR / name
 
-    return colA.apply(normalize_cell)
 
+def _remove_stale_pct_indexes(xlsx_path: str, keep: Path) -> None:
+    """Delete indexes of earlier versions of ``xlsx_path``."""
+    stale_re = re.compile(re.escape(Path(xlsx_path).stem) + r"-\d+-\d+-v\d+\.json")
+    for path in PCT_INDEX_CACHE_DIR.iterdir():
+        if path != keep and stale_re.fullmatch(path.name):
+            try:
+                path.unlink()
+            except OSError as e:
+                debug_print(f"Could not remove stale Column A index {path}: {e}")
 
-def _card_finder_js(names: List[Tuple[str, str]]) -> str:
-    js_template = r"""
+
+def _load_column_a_index(xlsx_path: str) -> Dict[str, List[int]]:
+    """_load_column_a_as_keys, answered from the on-disk cache when possible.
+
+    Repeated scans against an unchanged workbook skip openpyxl entirely. A
+    missing or unreadable cache just falls back to reading the sheet.
+    """
+    cache_path = _pct_index_cache_path(xlsx_path)
+    try:
+        value_to_rows = read_json(cache_path)
+        if isinstance(value_to_rows, dict):
+            debug_print(f"Using Column A index cache: {cache_path}")
+            return value_to_rows
+        debug_print(f"Ignoring malformed Column A index cache {cache_path}")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        debug_print(f"Ignoring unreadable Column A index cache {cache_path}: {e}")
+
+    value_to_rows = _load_column_a_as_keys(xlsx_path)
+    try:
+        PCT_INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        part_path = _part_path(cache_path)
+        write_json(part_path, value_to_rows)
+        os.replace(part_path, cache_path)
+        _remove_stale_pct_indexes(xlsx_path, cache_path)
+    except OSError as e:
+        debug_print(f"Not caching Column A index: {e}")
+    return value_to_rows
+
+
+# Filled by plain str.replace of the placeholders; the JS is full of "$" and
+# braces, so no format/Template escaping is needed
+_JS_NAMES_PLACEHOLDER = "__NAMES__"
+_JS_BUCKETS_PLACEHOLDER = "__BUCKETS__"
+_JS_TEMPLATE = r"""
 // JavaScript snippet to find a person card by name on a webpage
-(async () => {{
+(async () => {
   // --- DEBUG SETUP ---
   myDebug = 2;
-  myDebugLevels = {{
+  myDebugLevels = {
     DEBUG: 1,
     INFO: 2,
     WARN: 3,
-  }};
+  };
   window.pFound = null; // global flag to be set manually in console
   window.nameSearchingFor = null; // current name being searched for
 
@@ -187,26 +297,29 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
   // const personName = prompt("Enter person's name (first last):", lastPerson);
 
   // Check if names were provided from Python script
-  const providedNames = {names};
+  const providedNames = __NAMES__;
+  // [[letterFolder, rangeFolder] or null, [indexes into providedNames]],
+  // worked out by Python so each range folder is expanded once
+  const buckets = __BUCKETS__;
 
-  if (!providedNames.length > 0) {{
+  if (!providedNames.length > 0) {
     console.error('No names provided from Python script.');
     return;
-  }}
+  }
 
-  const peopleCardData = providedNames.map((name) => ({{
+  const peopleCardData = providedNames.map((name) => ({
     name,
     found: false,
     headshotImgString: null,
     pCardName: null,
-  }}));
+  }));
 
   // --- Helpers ---
   const sanitizeName = (name) =>
     String(name || '')
       .toLowerCase()
       .normalize('NFD')
-      .replace(/\p{{Diacritic}}/gu, '')
+      .replace(/\p{Diacritic}/gu, '')
       .replace(/[-_]/g, ' ')
       .replace(/\s+/g, ' ')
       .trim();
@@ -215,54 +328,54 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
     String(s || '')
       .toLowerCase()
       .normalize('NFD')
-      .replace(/\p{{Diacritic}}/gu, '')
+      .replace(/\p{Diacritic}/gu, '')
       .replace(/[^a-z0-9\s-]/g, '')
       .replace(/\s+/g, '-')
       .replace(/-+/g, '-')
       .replace(/^-|-$/g, '');
 
-  function parsePersonName(full) {{
+  function parsePersonName(full) {
     const s = sanitizeName(full);
     const parts = s.split(' ');
-    if (parts.length < 2) {{
+    if (parts.length < 2) {
       throw new Error('Expected "first last" but got: ' + full);
-    }}
+    }
     const first = parts[0];
     const last = parts.slice(1).join(' ');
-    return {{ first, last }};
-  }}
+    return { first, last };
+  }
 
-  async function countdown(seconds) {{
+  async function countdown(seconds) {
     // if seconds === 0, wait until window.pFound === true
-    if (seconds === 0) {{
+    if (seconds === 0) {
       window.pFound = null;
       let num_waits = 0;
       console.log('Waiting (up to 30s) for window.pFound to be true...');
-      if (window.nameSearchingFor) {{
-        console.log(`🔎 Search for: ${{window.nameSearchingFor}}`);
-      }}
+      if (window.nameSearchingFor) {
+        console.log(`🔎 Search for: ${window.nameSearchingFor}`);
+      }
       console.log('***DIRECTIONS***');
       console.log('1. Set window.pFound = true in the console to grab the headshot string.');
       console.log('2. If person not found, set window.pFound = false to skip.');
       console.log('3. If nothing happens after 30s, the script will continue automatically.');
       const waitCycles = 20;
-      while (window.pFound === null && num_waits < waitCycles) {{
-        if (window.nameSearchingFor) {{
-          console.log(`Moving on in ${{(waitCycles - num_waits) * 3}} seconds... \nName: ${{window.nameSearchingFor}}`);
-        }} else {{
+      while (window.pFound === null && num_waits < waitCycles) {
+        if (window.nameSearchingFor) {
+          console.log(`Moving on in ${(waitCycles - num_waits) * 3} seconds... \nName: ${window.nameSearchingFor}`);
+        } else {
           console.log('Waiting...');
-        }}
+        }
         await new Promise((resolve) => setTimeout(resolve, 3000));
         num_waits++;
-      }}
-      console.log(`${{window.pFound === true ? '✅ Proceeding with data of currently selected person.' : window.pFound === false ? '❌ Skipping to next person.' : '⌛️ Timeout reached without confirmation, skipping.'}}`);
+      }
+      console.log(`${window.pFound === true ? '✅ Proceeding with data of currently selected person.' : window.pFound === false ? '❌ Skipping to next person.' : '⌛️ Timeout reached without confirmation, skipping.'}`);
       return;
-    }}
-    for (let i = seconds; i > 0; i--) {{
-      console.log(`Moving to next provider in ${{i}}...`);
+    }
+    for (let i = seconds; i > 0; i--) {
+      console.log(`Moving to next provider in ${i}...`);
       await new Promise((resolve) => setTimeout(resolve, 1000));
-    }}
-  }}
+    }
+  }
 
   const BASE_PATH = [
     'Redesign Data',
@@ -271,160 +384,192 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
     'People Card Data',
   ];
 
-  function computeLetterAndRange(last) {{
-    const clean = canonicalKebab(last).replace(/-/g, '');
-    const firstLetter = (clean[0] || '').toUpperCase();
-    if (!firstLetter || !/[A-Z]/.test(firstLetter)) {{
-      throw new Error('Last name must start with A-Z: ' + last);
-    }}
-    const secondLetter = (clean[1] || 'a').toLowerCase();
-    let bucketStart, bucketEnd;
-    if (secondLetter >= 'a' && secondLetter <= 'i') {{
-      bucketStart = 'a';
-      bucketEnd = 'i';
-    }} else if (secondLetter >= 'j' && secondLetter <= 'r') {{
-      bucketStart = 'j';
-      bucketEnd = 'r';
-    }} else {{
-      bucketStart = 's';
-      bucketEnd = 'z';
-    }}
-    const letterFolder = firstLetter; // e.g. "S"
-    const rangeFolder = `${{firstLetter}}${{bucketStart}}-${{firstLetter}}${{bucketEnd}}`; // e.g. "Sj-Sr"
-    return {{ letterFolder, rangeFolder }};
-  }}
-
-  function buildExactRegex(last, first) {{
+  function buildExactRegex(last, first) {
     const lastK = canonicalKebab(last);
     const firstK = canonicalKebab(first);
-    const pattern = `^${{lastK}}-${{firstK}}-\\d{{4}}$`;
+    const pattern = `^${lastK}-${firstK}-\\d{4}$`;
     if (myDebug < myDebugLevels.INFO) console.log('Exact regex:', pattern);
     return new RegExp(pattern, 'i');
-  }}
+  }
 
-  function buildLastPlusFirstInitialRegex(last, first) {{
+  function buildLastPlusFirstInitialRegex(last, first) {
     const lastK = canonicalKebab(last);
     const firstInitial = canonicalKebab(first).charAt(0) || '';
     // allow hyphens in first-name remainder, keep required 4 digits at end
-    const pattern = `^${{lastK}}-${{firstInitial}}[a-z0-9-]*-\\d{{4}}$`;
+    const pattern = `^${lastK}-${firstInitial}[a-z0-9-]*-\\d{4}$`;
     if (myDebug < myDebugLevels.INFO)
       console.log('Last+FirstInitial regex:', pattern);
     return new RegExp(pattern, 'i');
-  }}
+  }
 
-  function buildLastOnlyRegex(last) {{
+  function buildLastOnlyRegex(last) {
     const lastK = canonicalKebab(last);
-    const pattern = `^${{lastK}}-[a-z0-9-]+-\\d{{4}}$`;
+    const pattern = `^${lastK}-[a-z0-9-]+-\\d{4}$`;
     if (myDebug < myDebugLevels.INFO) console.log('Last-only regex:', pattern);
     return new RegExp(pattern, 'i');
-  }}
+  }
 
-  function buildFirstLetterRegex(last) {{
+  function buildFirstLetterRegex(last) {
     const letter = (canonicalKebab(last)[0] || '').toLowerCase();
-    const pattern = `^${{letter}}[a-z0-9-]*-\\d{{4}}$`;
+    const pattern = `^${letter}[a-z0-9-]*-\\d{4}$`;
     if (myDebug < myDebugLevels.INFO)
       console.log('First-letter regex:', pattern);
     return new RegExp(pattern, 'i');
-  }}
+  }
+
+  // Match tiers, most specific first. Each tier's pattern also matches
+  // everything the tiers before it match.
+  const MATCH_TIERS = [
+    'exact',
+    'last_first_initial',
+    'lastname_only',
+    'first_letter_lastname',
+  ];
+
+  // One anchored alternative per tier, in MATCH_TIERS order, so the first
+  // named group that matches a node's text is that node's best tier
+  function buildUnionRegex(last, first) {
+    const sources = {
+      exact: buildExactRegex(last, first).source,
+      last_first_initial: buildLastPlusFirstInitialRegex(last, first).source,
+      lastname_only: buildLastOnlyRegex(last).source,
+      first_letter_lastname: buildFirstLetterRegex(last).source,
+    };
+    const pattern = MATCH_TIERS.map((tier) => `(?<${tier}>${sources[tier]})`).join('|');
+    return new RegExp(pattern, 'i');
+  }
 
   // --- Tree search utils ---
+  // Resolve as soon as probe() returns something truthy. Instead of polling the
+  // whole DOM on a timer, re-probe only when content tree nodes are added.
+  function waitForTreeNodes(probe, timeout, errorMessage) {
+    return new Promise((resolve, reject) => {
+      const initial = probe();
+      if (initial) return resolve(initial);
+      let timer = null;
+      const obs = new MutationObserver((mutations) => {
+        const treeChanged = mutations.some((m) =>
+          Array.from(m.addedNodes).some(
+            (n) =>
+              n.nodeType === Node.ELEMENT_NODE &&
+              (n.matches('.scContentTreeNode') ||
+                n.querySelector('.scContentTreeNode'))
+          )
+        );
+        if (!treeChanged) return;
+        const result = probe();
+        if (result) {
+          obs.disconnect();
+          clearTimeout(timer);
+          resolve(result);
+        }
+      });
+      obs.observe(document.body, { childList: true, subtree: true });
+      timer = setTimeout(() => {
+        obs.disconnect();
+        reject(new Error(errorMessage));
+      }, timeout);
+    });
+  }
+
   const findNodeExact = (name) =>
     Array.from(document.querySelectorAll('.scContentTreeNode')).find(
-      (node) => {{
+      (node) => {
         const target = sanitizeName(name);
         const span = node.querySelector('span');
-        if (!span) {{
+        if (!span) {
           console.warn('no span for', name);
           return false;
-        }}
+        }
         return span && sanitizeName(span.textContent) === target;
-      }}
+      }
     );
 
-  function waitForMatchExact(name, timeout = 5000) {{
-    return new Promise((resolve, reject) => {{
-      const start = Date.now();
-      (function check() {{
-        const m = findNodeExact(name);
-        if (m) return resolve(m);
-        if (Date.now() - start > timeout)
-          return reject(new Error('Timeout waiting for ' + name));
-        setTimeout(check, 500);
-      }})();
-    }});
-  }}
-
-  async function expand(name) {{
+  function waitForMatchExact(name, timeout = 5000) {
+    return waitForTreeNodes(
+      () => findNodeExact(name),
+      timeout,
+      'Timeout waiting for ' + name
+    );
+  }
+
+  async function expand(name) {
     const node = await waitForMatchExact(name);
     const arrow = node.querySelector('img');
-    if (!arrow) {{
+    if (!arrow) {
       console.warn('no expand arrow for', name);
       return node;
-    }}
-    if (myDebug < myDebugLevels.INFO) {{
+    }
+    if (myDebug < myDebugLevels.INFO) {
       console.log('expanding', name, 'found node:', node, 'with arrow:', arrow);
-    }}
-    if (node.lastElementChild && node.lastElementChild.tagName === 'DIV') {{
+    }
+    if (node.lastElementChild && node.lastElementChild.tagName === 'DIV') {
       return node;
-    }}
+    }
     arrow.click();
     await new Promise((r) => setTimeout(r, 250));
     return node;
-  }}
+  }
 
-  function findNodesByRegex(regex) {{
-    const nodes = Array.from(
-      document.querySelectorAll('.scContentTreeNode')
-    ).filter((node) => {{
+  // Single pass over the nodes under root (the expanded range folder):
+  // tier -> first node matching that tier (or a more specific one)
+  function findNodesByTier(root, unionRe) {
+    const byTier = {};
+    for (const node of root.querySelectorAll('.scContentTreeNode')) {
       const span = node.querySelector('span');
-      if (!span) return false;
-      const txt = (span.textContent || '').trim();
-      const ok = regex.test(txt);
-      if (myDebug < myDebugLevels.INFO) {{
-        // console.log('Testing node text:', txt, 'against', regex, '=>', ok);
-      }}
-      return ok;
-    }});
-    return nodes;
-  }}
-
-  function waitForRegex(regex, timeout = 5000) {{
-    return new Promise((resolve, reject) => {{
-      const start = Date.now();
-      (function check() {{
-        const matches = findNodesByRegex(regex);
-        if (matches.length) return resolve(matches);
-        if (Date.now() - start > timeout)
-          return reject(new Error('Timeout waiting for regex: ' + regex));
-        setTimeout(check, 500);
-      }})();
-    }});
-  }}
-
-  async function clickRegexMatch(regex, timeout = 2500) {{
-    const matches = await waitForRegex(regex, timeout);
-    const node = matches[0];
+      if (!span) continue;
+      const m = unionRe.exec((span.textContent || '').trim());
+      if (!m) continue;
+      const best = MATCH_TIERS.findIndex((tier) => m.groups[tier] !== undefined);
+      for (let i = best; i < MATCH_TIERS.length; i++) {
+        if (!byTier[MATCH_TIERS[i]]) byTier[MATCH_TIERS[i]] = node;
+      }
+    }
+    return byTier;
+  }
+
+  // Wait (while the folder's children load) for an exact match; only once
+  // the timeout passes are the lower tiers, possibly empty, settled for
+  async function waitForTiers(root, unionRe, timeout = 3000) {
+    try {
+      return await waitForTreeNodes(
+        () => {
+          const byTier = findNodesByTier(root, unionRe);
+          return byTier.exact ? byTier : null;
+        },
+        timeout,
+        'Timeout waiting for exact match: ' + unionRe
+      );
+    } catch (e) {
+      if (myDebug < myDebugLevels.WARN) {
+        console.warn('No exact match:', e.message);
+      }
+      return findNodesByTier(root, unionRe);
+    }
+  }
+
+  function clickNode(node) {
     const span = node.querySelector('span');
-    if (span) {{
-      if (myDebug < myDebugLevels.WARN) {{
+    if (span) {
+      if (myDebug < myDebugLevels.WARN) {
         console.log('Clicking node:', span.textContent);
-      }}
+      }
       span.click();
       return true;
-    }} else {{
+    } else {
       console.warn('no span to click for regex match');
       return false;
-    }}
-  }}
+    }
+  }
 
-  async function getHeadshotImageString() {{
+  async function getHeadshotImageString() {
     let headshotImgStr = null;
     // Find the span whose text contains "Headshot Image" (non-strict match)
     const targetSpan = Array.from(document.querySelectorAll('span')).find(
       (span) => (span.textContent || '').includes('Headshot Image')
     );
 
-    if (targetSpan) {{
+    if (targetSpan) {
       // Step 1: get the parent of that span
       const parent = targetSpan.parentElement;
       // Step 2: get the next sibling element
@@ -433,143 +578,154 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
       const input = sibling?.querySelector('input');
       // Step 4: get the value attribute
       headshotImgStr = input?.getAttribute('value');
-    }} else {{
+    } else {
       console.warn("No span containing 'Headshot Image' found.");
-    }}
-    if (myDebug < myDebugLevels.WARN) {{
+    }
+    if (myDebug < myDebugLevels.WARN) {
       console.log('Headshot image string:', headshotImgStr);
-    }}
+    }
     return headshotImgStr || null;
-  }}
+  }
 
-  const getPeopleCardName = () => {{
+  const getPeopleCardName = () => {
     let pCardName = null;
     const scContentTreeNodeActive = document.querySelector('.scContentTreeNodeActive');
-    if (scContentTreeNodeActive) {{
+    if (scContentTreeNodeActive) {
         pCardName = scContentTreeNodeActive.textContent.trim();
-    }}
+    }
     return pCardName;
-  }}
+  }
       
-  for (const person of peopleCardData) {{
-    try {{
+  const ordered = buckets.flatMap(([folders, idxs]) =>
+    idxs.map((idx) => [folders, idx])
+  );
+  let expandedKey = null;
+  let folderNode = null;
+  for (const [folders, idx] of ordered) {
+    const person = peopleCardData[idx];
+    try {
       // 1) Parse and validate the person's name
       const [first, last] = person.name;
       // update global hint for the user during manual countdowns
-      window.nameSearchingFor = `${{first}} ${{last}}`;
-      if (myDebug < myDebugLevels.WARN) {{
-        console.log(`Searching for: ${{person.name}} => first: ${{first}}, last: ${{last}}`);
-        console.log(`nameSearchingFor set to: ${{window.nameSearchingFor}}`);
-      }}
-      if (!first || !last) {{
+      window.nameSearchingFor = `${first} ${last}`;
+      if (myDebug < myDebugLevels.WARN) {
+        console.log(`Searching for: ${person.name} => first: ${first}, last: ${last}`);
+        console.log(`nameSearchingFor set to: ${window.nameSearchingFor}`);
+      }
+      if (!first || !last) {
         console.warn('Skipping unparsable name:', person.name);
         continue;
-      }}
-
-      // 2) Compute path and expand to range folder
-      const {{ letterFolder, rangeFolder }} = computeLetterAndRange(last);
-      const expandNames = [...BASE_PATH, letterFolder, rangeFolder];
-      for (const name of expandNames) {{
-        await expand(name);
-      }}
+      }
+
+      // 2) Expand to the range folder, once per bucket
+      if (!folders) {
+        throw new Error('Last name must start with A-Z: ' + last);
+      }
+      // Reuse the expanded folder only while it is still in the tree and open
+      const bucketKey = folders.join('/');
+      const folderOpen =
+        folderNode &&
+        folderNode.isConnected &&
+        folderNode.lastElementChild &&
+        folderNode.lastElementChild.tagName === 'DIV';
+      if (bucketKey !== expandedKey || !folderOpen) {
+        for (const name of [...BASE_PATH, ...folders]) {
+          folderNode = await expand(name);
+        }
+        expandedKey = bucketKey;
+      }
 
-      // 3) Build regex patterns
-      const exactRe = buildExactRegex(last, first);
-      const lastPlusInitialRe = buildLastPlusFirstInitialRegex(last, first);
-      const lastOnlyRe = buildLastOnlyRegex(last);
-      const firstLetterRe = buildFirstLetterRegex(last);
+      // 3) Classify the range folder's nodes against every tier in one scan
+      const unionRe = buildUnionRegex(last, first);
+      const byTier = await waitForTiers(folderNode, unionRe, 3000);
 
       // Helper function to attempt a match and update person data if successful
-      async function attemptMatch(person, scope, regex, timeout) {{
-        try {{
+      async function attemptMatch(person, scope, node) {
+        try {
           // Fix: avoid stale window.pFound impacting subsequent matches.
           // - For 'exact' scope: if we clicked a match, treat as found immediately.
           // - For other scopes: wait for manual confirmation via countdown() and check window.pFound.
-          const clicked = await clickRegexMatch(regex, timeout);
+          if (!node) return false;
+          const clicked = clickNode(node);
           if (!clicked) return false;
 
-          if (scope === 'exact') {{
+          if (scope === 'exact') {
             await new Promise((r) => setTimeout(r, 2000));
             person.found = true;
             person.pCardName = getPeopleCardName();
             person.headshotImgString = await getHeadshotImageString();
             return true;
-          }} else {{
+          } else {
             const [first, last] = person.name;
-            switch (scope) {{
+            switch (scope) {
               case 'last_first_initial':
-                console.log(`Matched last + first initial: ${{last.toUpperCase()}}, ${{first.charAt(0).toUpperCase()}}`);
+                console.log(`Matched last + first initial: ${last.toUpperCase()}, ${first.charAt(0).toUpperCase()}`);
                 break;
 
               case 'lastname_only':
-                console.log(`Matched last: ${{last.toUpperCase()}}`);
+                console.log(`Matched last: ${last.toUpperCase()}`);
                 break;
 
               case 'first_letter_lastname':
-                console.log(`Matched first letter of last name: ${{last.charAt(0).toUpperCase()}}`);
+                console.log(`Matched first letter of last name: ${last.charAt(0).toUpperCase()}`);
                 break;
               default:
                 break;
-            }}
-          }}
+            }
+          }
 
           await countdown(0); // resets window.pFound to null and waits for user input
-          if (window.pFound === true) {{
+          if (window.pFound === true) {
             await new Promise((r) => setTimeout(r, 2200)); // waiting for the UI to update...
             person.found = true;
             person.pCardName = getPeopleCardName();
             person.headshotImgString = await getHeadshotImageString();
             return true;
-          }} else {{
-            if (myDebug < myDebugLevels.WARN) {{
-              console.warn(`Skipping headshot grab as pFound is not true for scope "${{scope}}".`);
-            }}
-          }}
-        }} catch (e) {{
-          if (myDebug < myDebugLevels.WARN) {{
-            console.warn(`Scope of "${{scope}}" match failed:`, e.message);
-          }}
-        }}
+          } else {
+            if (myDebug < myDebugLevels.WARN) {
+              console.warn(`Skipping headshot grab as pFound is not true for scope "${scope}".`);
+            }
+          }
+        } catch (e) {
+          if (myDebug < myDebugLevels.WARN) {
+            console.warn(`Scope of "${scope}" match failed:`, e.message);
+          }
+        }
         return false;
-      }}
+      }
 
       // 4) Attempt exact match first
-      if (await attemptMatch(person, 'exact', exactRe, 3000)) {{
+      if (await attemptMatch(person, 'exact', byTier.exact)) {
         continue;
-      }}
-
-      // 5) Fallback attempts in order
-      const fallbacks = [
-        {{ scope: 'last_first_initial', regex: lastPlusInitialRe, timeout: 2000 }},
-        {{ scope: 'lastname_only', regex: lastOnlyRe, timeout: 2000 }},
-        {{ scope: 'first_letter_lastname', regex: firstLetterRe, timeout: 2000 }},
-      ];
+      }
 
+      // 5) Fallback attempts in order; tiers with no node are skipped
       let found = false;
 
-      for (const {{ scope, regex, timeout }} of fallbacks) {{
+      for (const scope of MATCH_TIERS.slice(1)) {
+          if (!byTier[scope]) continue;
           window.pFound = null; // reset before each attempt
-          if (myDebug < myDebugLevels.WARN) {{
-            console.log(`Attempting fallback scope: ${{scope}} with regex: ${{regex}}`);
-          }}
+          if (myDebug < myDebugLevels.WARN) {
+            console.log(`Attempting fallback scope: ${scope} with regex: ${unionRe}`);
+          }
 
-        found = await attemptMatch(person, scope, regex, timeout);
+        found = await attemptMatch(person, scope, byTier[scope]);
 
-        if (found || window.pFound === false) {{
-          if (myDebug < myDebugLevels.WARN) {{
-            console.log(`Found: ${{found}}, pFound: ${{window.pFound}} after scope: ${{scope}}`);
-          }}
+        if (found || window.pFound === false) {
+          if (myDebug < myDebugLevels.WARN) {
+            console.log(`Found: ${found}, pFound: ${window.pFound} after scope: ${scope}`);
+          }
           break;
-        }}
-      }}
+        }
+      }
 
-      if (!found) {{
+      if (!found) {
         console.warn('No matches found for:', person.name);
-      }}
-    }} catch (e) {{
+      }
+    } catch (e) {
       console.error('Error processing person:', person.name, e);
-    }}
-  }}
+    }
+  }
   console.log('People card data results:', peopleCardData);
   
   // Format data for easy copying to CLI
@@ -578,7 +734,7 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
   console.log('='.repeat(60));
   
   // Create delimited format: firstName|lastName|found|headshotImg|pCardName
-  const formattedLines = peopleCardData.map(person => {{
+  const formattedLines = peopleCardData.map(person => {
     const firstName = person.name[0] || '';
     const lastName = person.name[1] || '';
     const found = person.found ? 'true' : 'false';
@@ -589,16 +745,74 @@ def _card_finder_js(names: List[Tuple[str, str]]) -> str:
     return [firstName, lastName, found, headshot, pCardName]
       .map(field => String(field).replace(/;/g, '&#59;'))
       .join(';');
-  }}).join('\\n');
+  }).join('\\n');
   
     console.log(formattedLines);
   console.log('='.repeat(60));
   console.log('💡 Copy all the lines above and paste them into the CLI');
   
   return peopleCardData;
-}})();
+})();
 """
-    return js_template.format(names=json.dumps(names))
+
+
+@functools.lru_cache(maxsize=1)
+def _try_pyperclip():
+    """Import pyperclip on first use; a failed import is remembered as None."""
+    try:
+        import pyperclip  # type: ignore
+
+        return pyperclip
+    except Exception:
+        return None
+
+
+def _copy_to_clipboard(pc, js: str) -> bool:
+    try:
+        pc.copy(js)
+    except Exception as e:
+        print(f"\n⚠️  Clipboard copy failed ({e}). Here is the JavaScript snippet:\n")
+        print(js)
+        return False
+    return True
+
+
+_BUCKET_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+
+def _card_bucket(last: str) -> Optional[Tuple[str, str]]:
+    """(letterFolder, rangeFolder) of the People Card Data tree for ``last``.
+
+    Mirrors the JS canonicalKebab with hyphens dropped: lowercase, NFD, keep
+    only a-z0-9. The second character picks the Xa-Xi / Xj-Xr / Xs-Xz range
+    (a digit goes to Xs-Xz, a one-letter name to Xa-Xi). Returns None when
+    the name doesn't start with a letter.
+    """
+    clean = [
+        c for c in unicodedata.normalize("NFD", last.lower()) if c in _BUCKET_CHARS
+    ]
+    if not clean or not clean[0].isalpha():
+        return None
+    letter = clean[0].upper()
+    second = clean[1] if len(clean) > 1 else "a"
+    if second.isdigit() or second > "r":
+        start, end = "s", "z"
+    elif second > "i":
+        start, end = "j", "r"
+    else:
+        start, end = "a", "i"
+    return letter, f"{letter}{start}-{letter}{end}"
+
+
+def _card_finder_js(names: List[Tuple[str, str]]) -> str:
+    # group people by range folder, in order of first appearance
+    buckets = {}
+    for idx, (_, last) in enumerate(names):
+        buckets.setdefault(_card_bucket(last or ""), []).append(idx)
+    dumps = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+    return _JS_TEMPLATE.replace(_JS_NAMES_PLACEHOLDER, dumps(names)).replace(
+        _JS_BUCKETS_PLACEHOLDER, dumps(list(buckets.items()))
+    )
 
 
 def cmd_scan(args, state=None):
@@ -630,7 +844,7 @@ def cmd_scan(args, state=None):
         return
 
     try:
-        colA_norm = _load_column_a_as_keys(xlsx_path)
+        value_to_rows = _load_column_a_index(xlsx_path)
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return
@@ -641,52 +855,50 @@ def cmd_scan(args, state=None):
         f"Loaded {len(names)} name(s) from {file_type} (credentials stripped if present).\n"
     )
 
-    value_to_rows = {}
-    # Enumerate the normalized Series values to get a guaranteed integer position (1-based Excel row number)
-    for pos, val in enumerate(colA_norm.tolist(), start=1):
-        if not val:
-            continue
-        value_to_rows.setdefault(val, []).append(pos)
-
     total_found = 0
     # After loading names, preserve original list for merging later
     if state is not None:
         state.scan_original_fullnames = list(names)
-        state.scan_pct_map = {}
+        state.scan_pct_map = defaultdict(list)
         state.scan_export_rows = []
-    # Matching loop
+    # Tokenize each name once; the tokens feed both the key variants and the
+    # (first, last) pairs used after matching
+    parsed = []
     for name in names:
-        variants = key_variants_from_name(name)
-        found_rows = []
-        matched_pct_keys = set()
-        for v in variants:
-            if v in value_to_rows:
-                found_rows.extend(value_to_rows[v])
-                # Reconstruct approximate PCT raw key base (v) for mapping
-                matched_pct_keys.add(v)
-        found_rows = sorted(set(found_rows))
+        tokens = tokenize_name(name)
+        parsed.append((name, key_variants_from_tokens(*tokens), tokens))
+
+    for name, variants, (first, _, last) in parsed:
+        # Matched variants double as the approximate PCT raw keys for mapping.
+        # variants holds at most two unique keys, so probing beats a set build
+        matched_pct_keys = [v for v in variants if v in value_to_rows]
+        if len(matched_pct_keys) == 1:
+            # row lists are appended in sheet order, already sorted and unique
+            found_rows = value_to_rows[matched_pct_keys[0]]
+        elif matched_pct_keys:
+            found_rows = sorted(
+                set().union(*(value_to_rows[v] for v in matched_pct_keys))
+            )
+        else:
+            found_rows = []
         key_display = " OR ".join(variants) if variants else "(unparsable)"
         if found_rows:
             total_found += 1
             print(f"[✅] {name} -> {key_display}  |  Rows: {found_rows}")
             if state is not None:
-                first, _, last = tokenize_name(name)
                 k = (first.lower(), last.lower())
-                bucket = state.scan_pct_map.setdefault(k, set())
-                bucket.update(matched_pct_keys)
+                state.scan_pct_map[k].extend(matched_pct_keys)
         else:
             print(f"[❌] {name} -> {key_display}")
 
     print(f"\nDone. {total_found}/{len(names)} had at least one match in Column A.")
 
-    names = [
-        (first, last)
-        for name in names
-        if (first := tokenize_name(name)[0]) and (last := tokenize_name(name)[2])
+    parsed_pairs = [
+        (first, last) for _, _, (first, _, last) in parsed if first and last
     ]
 
     # At this point, we have the list of (first, last) names to process
-    if not names:
+    if not parsed_pairs:
         print("No valid names to process after tokenization.")
         return
 
@@ -695,7 +907,7 @@ def cmd_scan(args, state=None):
 
     # create arg_list which looks like ["first", "last", "|", "first", "last", "|", ...]
     arg_list = []
-    for first, last in names:
+    for first, last in parsed_pairs:
         arg_list.append(first)
         arg_list.append(last)
         arg_list.append("|")
@@ -728,14 +940,13 @@ def cmd_scan(args, state=None):
 
     # Generate JavaScript snippet to find people cards + headshot information
 
-    js = _card_finder_js(names)
-
-    try:
-        import pyperclip  # type: ignore
+    js = _card_finder_js(parsed_pairs)
 
-        pyperclip.copy(js)
-        print("\n✅ JavaScript snippet copied to clipboard.")
-    except Exception:
+    pc = _try_pyperclip()
+    if pc is not None:
+        if _copy_to_clipboard(pc, js):
+            print("\n✅ JavaScript snippet copied to clipboard.")
+    else:
         print("\n⚠️  Install pyperclip to enable clipboard copy: pip install pyperclip")
         print("Here is the JavaScript snippet:\n")
         print(js)
@@ -803,6 +1014,16 @@ def cmd_scan(args, state=None):
         print("\n🏁 Scan command completed")
 
 
+def _write_numbered(lines) -> None:
+    """Echo lines as a numbered list with a single stdout write."""
+    if not lines:
+        return
+    sys.stdout.write(
+        "\n".join(f"  {i:2d}: {line}" for i, line in enumerate(lines, 1)) + "\n"
+    )
+    sys.stdout.flush()
+
+
 def _process_pasted_data(lines, state=None):
     """Process and display pasted delimited people card data."""
     print("\n" + "=" * 60)
@@ -811,35 +1032,27 @@ def _process_pasted_data(lines, state=None):
 
     # Print raw data for sanity check
     print("🔍 Raw pasted data:")
-    for i, line in enumerate(lines, 1):
-        print(f"  {i:2d}: {line}")
+    _write_numbered(lines)
     print("\n" + "-" * 60)
 
-    # First, handle the case where data might be on a single line with \n separators
-    all_lines = []
-    for line in lines:
-        # Split on literal \n if it exists, otherwise treat as single line
-        if "\\n" in line:
-            # Handle literal \n separators
-            split_lines = line.split("\\n")
-            all_lines.extend(split_lines)
-        else:
-            all_lines.append(line)
-
-    # Remove empty lines
-    all_lines = [line.strip() for line in all_lines if line.strip()]
+    # Data might be on a single line with literal \n separators, so turn those
+    # into real newlines and split everything in one pass (dropping empty lines)
+    text = "\n".join(lines).replace("\\n", "\n")
+    all_lines = [line.strip() for line in text.splitlines() if line.strip()]
 
     print(f"📝 Parsed into {len(all_lines)} individual records:")
-    for i, line in enumerate(all_lines, 1):
-        print(f"  {i:2d}: {line}")
+    _write_numbered(all_lines)
     print("\n" + "-" * 60)
 
     # Parse delimited data
     parsed_people = []
-    for line_num, line in enumerate(all_lines, 1):
+    # csv.reader consumes the list directly; no need to rebuild one big string.
+    # Quotes carry no meaning in this format, so they stay literal
+    reader = csv.reader(all_lines, delimiter=";", quoting=csv.QUOTE_NONE)
+    for line_num, (line, row) in enumerate(zip(all_lines, reader), 1):
         try:
-            # Split by semicolon and unescape
-            parts = [part.replace("&#59;", ";") for part in line.split(";")]
+            # Unescape semicolons only in the fields that actually contain them
+            parts = [f.replace("&#59;", ";") if "&#59;" in f else f for f in row]
 
             if len(parts) >= 3:
                 first_name = parts[0] if len(parts) > 0 else ""
@@ -870,6 +1083,15 @@ def _process_pasted_data(lines, state=None):
         print("❌ No valid data could be parsed from the input")
 
 
+# Column order of the scan export; every export row is a copy of this
+_EMPTY_EXPORT_ROW = {
+    "Name (PCT)": "",
+    "Full Name": "",
+    "Headshot String": "",
+    "Name (Sitecore)": "",
+}
+
+
 def _process_received_data(data, state=None):
     """Process and display the received people card data.
 
@@ -878,25 +1100,29 @@ def _process_received_data(data, state=None):
     """
     active_state = state
 
-    print("\n" + "=" * 60)
-    print("📊 RECEIVED PEOPLE CARD DATA")
-    print("=" * 60)
+    # Build the whole report in memory and write it to the terminal in one go
+    out = io.StringIO()
+    emit = functools.partial(print, file=out)
+
+    emit("\n" + "=" * 60)
+    emit("📊 RECEIVED PEOPLE CARD DATA")
+    emit("=" * 60)
 
     # Print raw data for sanity check as requested
-    print("🔍 Raw data received:")
-    print(json.dumps(data, indent=2))
-    print("\n" + "-" * 60)
+    emit("🔍 Raw data received:")
+    emit(json.dumps(data, indent=2))
+    emit("\n" + "-" * 60)
 
     # Process and summarize the data
     total_people = len(data)
     found_count = sum(1 for person in data if person.get("found", False))
 
-    print(f"📈 SUMMARY:")
-    print(f"   Total people processed: {total_people}")
-    print(f"   People found: {found_count}")
-    print(f"   People not found: {total_people - found_count}")
+    emit(f"📈 SUMMARY:")
+    emit(f"   Total people processed: {total_people}")
+    emit(f"   People found: {found_count}")
+    emit(f"   People not found: {total_people - found_count}")
 
-    print(f"\n📋 DETAILED RESULTS:")
+    emit(f"\n📋 DETAILED RESULTS:")
     export_rows = []
     placeholder_headshots = []  # Track any people with placeholder headshots
     download_targets = []
@@ -912,20 +1138,22 @@ def _process_received_data(data, state=None):
         key = (first.lower(), last.lower())
         pct_keys = []
         if active_state is not None and hasattr(active_state, "scan_pct_map"):
-            pct_keys = sorted(active_state.scan_pct_map.get(key, []))
+            # Buckets are plain lists; dedupe once here rather than per insert
+            pct_keys = sorted(set(active_state.scan_pct_map.get(key, ())))
 
-        is_placeholder = _is_placeholder_headshot(headshot)
+        hs_norm = (headshot or "").strip().lower()
+        is_placeholder = _is_placeholder_headshot_norm(hs_norm)
 
         status = "✅ FOUND" if found else "❌ NOT FOUND"
         name_display = f"{first} {last}".strip()
-        print(f"   {i:2d}. {status} - {name_display}")
+        emit(f"   {i:2d}. {status} - {name_display}")
         if pct_keys:
-            print(f"       🔑 PCT Keys: {', '.join(pct_keys)}")
+            emit(f"       🔑 PCT Keys: {', '.join(pct_keys)}")
         if found and headshot:
             headshot_preview = headshot[:70] + ("..." if len(headshot) > 70 else "")
-            print(f"       🖼️  Headshot: {headshot_preview}")
+            emit(f"       🖼️  Headshot: {headshot_preview}")
         if pcard:
-            print(f"       📛 Sitecore Name: {pcard}")
+            emit(f"       📛 Sitecore Name: {pcard}")
 
         if (not found) or is_placeholder:
             download_targets.append(
@@ -938,28 +1166,19 @@ def _process_received_data(data, state=None):
             )
 
         # Build export rows (one row per PCT key if present, else one placeholder row)
+        person_row = _EMPTY_EXPORT_ROW.copy()
+        person_row["Full Name"] = name_display
+        person_row["Headshot String"] = headshot or ""
+        person_row["Name (Sitecore)"] = pcard or ""
         if pct_keys:
             for pct_key in pct_keys:
-                export_rows.append(
-                    {
-                        "Name (PCT)": pct_key,
-                        "Full Name": name_display,
-                        "Headshot String": headshot or "",
-                        "Name (Sitecore)": pcard or "",
-                    }
-                )
+                row = person_row.copy()
+                row["Name (PCT)"] = pct_key
+                export_rows.append(row)
         else:
-            export_rows.append(
-                {
-                    "Name (PCT)": "",
-                    "Full Name": name_display,
-                    "Headshot String": headshot or "",
-                    "Name (Sitecore)": pcard or "",
-                }
-            )
+            export_rows.append(person_row)
 
         # Capture placeholder headshots for end-of-command TODO summary
-        hs_norm = (headshot or "").strip().lower()
         if hs_norm == "headshots/p/p_placeholder":
             placeholder_headshots.append(
                 {
@@ -969,7 +1188,9 @@ def _process_received_data(data, state=None):
                 }
             )
 
-    print("=" * 60)
+    emit("=" * 60)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
     # Store export rows and placeholder summary in state for later use
     if active_state is not None:
@@ -999,24 +1220,158 @@ def _export_scan_results_to_excel(state):
     if not rows:
         print("⚠️  No export rows available.")
         return
-    try:
-        import pandas as pd
-    except ImportError:
-        print("❌ pandas is required to export Excel. Install with: pip install pandas")
-        return
-    df = pd.DataFrame(
-        rows, columns=["Name (PCT)", "Full Name", "Headshot String", "Name (Sitecore)"]
-    )
     exports_dir = Path("people_reports")
     exports_dir.mkdir(exist_ok=True)
     fname = exports_dir / f"{domain}_{row}.xlsx"
     try:
-        df.to_excel(fname, index=False)
+        # Write-only workbooks stream rows straight to the file, no styling
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        columns = list(_EMPTY_EXPORT_ROW)
+        ws.append(columns)
+        for export_row in rows:
+            # blank fields are written as empty cells rather than "" strings
+            ws.append([export_row.get(col) or None for col in columns])
+        wb.save(fname)
         print(f"✅ Export written: {fname}")
     except Exception as e:
         print(f"❌ Failed to write export: {e}")
 
 
+def _part_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + ".part")
+
+
+def _download_headshot(src: str, headshots_dir: Path, filename_stem: str) -> Path:
+    """Download ``src`` to a ``.part`` file next to its final headshot path.
+
+    The extension comes from the URL, or from the Content-Type when the URL
+    has none. Returns the final path; the caller moves the ``.part`` file
+    into place. The body is streamed to disk in 64 KiB chunks, and a failed
+    transfer leaves nothing behind.
+    """
+    with session.get(src, timeout=5, stream=True) as response:
+        response.raise_for_status()
+
+        ext = os.path.splitext(urlparse(src).path)[1]
+        if not ext:
+            content_type = (response.headers.get("Content-Type") or "").lower()
+            if "png" in content_type:
+                ext = ".png"
+            elif "gif" in content_type:
+                ext = ".gif"
+            elif "webp" in content_type:
+                ext = ".webp"
+            else:
+                ext = ".jpg"
+
+        output_path = headshots_dir / f"{filename_stem}{ext}"
+        part_path = _part_path(output_path)
+        try:
+            with open(part_path, "wb") as fh:
+                for chunk in response.iter_content(chunk_size=65536):
+                    fh.write(chunk)
+        except (requests.RequestException, OSError):
+            part_path.unlink(missing_ok=True)
+            raise
+    return output_path
+
+
+def _fetch_key(url):
+    """Dedupe key for a page URL: host lowercased, trailing slash dropped."""
+    parts = urlparse(url.strip())
+    return (
+        parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower())
+        .geturl()
+        .rstrip("/")
+    )
+
+
+def _skip_non_html(url, content_type):
+    """True (after reporting it) when a response is declared as non-HTML."""
+    if content_type and "text/html" not in content_type:
+        print(f"⏭️  Skipping {url} ({content_type})")
+        return True
+    return False
+
+
+def _parse_headshot_html(html):
+    # Some endpoints (or intermediaries) may percent-encode the HTML (!)
+    if html.lstrip().startswith("%3c") or html.lstrip().lower().startswith(
+        "%3c!doctype"
+    ):
+        try:
+            html = unquote(html)
+        except Exception:
+            pass
+
+    return BeautifulSoup(html, _HEADSHOT_PARSER, parse_only=_IMG_STRAINER)
+
+
+def _fetch_headshot_page(url):
+    """Fetch and parse one EXISTING_URLS page; returns (soup, final_url).
+
+    The body is only read once the headers show an HTML page; non-HTML
+    targets are skipped without downloading it and return None.
+    """
+    with session.get(url, timeout=5, stream=True) as page:
+        page.raise_for_status()
+        if _skip_non_html(url, page.headers.get("Content-Type", "")):
+            return None
+        # let Requests handle decoding
+        return _parse_headshot_html(page.text), page.url
+
+
+async def _fetch_headshot_pages_async(urls):
+    """aiohttp counterpart of _fetch_headshot_page for a whole URL list.
+
+    Returns one entry per url, in order: (soup, final_url), None for a
+    skipped page, or the exception raised while fetching it. Parsing runs
+    in the default executor so BeautifulSoup does not stall the loop.
+    """
+    loop = asyncio.get_running_loop()
+    timeout = aiohttp.ClientTimeout(total=5)
+    connector = aiohttp.TCPConnector(limit=_HEADSHOT_ASYNC_LIMIT)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as client:
+
+        async def fetch(url):
+            async with client.get(url) as page:
+                page.raise_for_status()
+                if _skip_non_html(url, page.headers.get("Content-Type", "")):
+                    return None
+                html = await page.text()
+                final_url = str(page.url)
+            soup = await loop.run_in_executor(None, _parse_headshot_html, html)
+            return soup, final_url
+
+        return await asyncio.gather(
+            *(fetch(url) for url in urls), return_exceptions=True
+        )
+
+
+def _fetch_headshot_pages(state, urls):
+    """Fetch every page in ``urls``; yields (url, result_or_exception).
+
+    ASYNC_FETCH uses aiohttp when it is installed and no SOCKS proxy is set
+    (aiohttp cannot route through it); otherwise a thread pool is used.
+    """
+    if state.get_variable("ASYNC_FETCH"):
+        if aiohttp is not None and not socks_url:
+            yield from zip(urls, asyncio.run(_fetch_headshot_pages_async(urls)))
+            return
+        print("⚠️  ASYNC_FETCH needs aiohttp and no SOCKS proxy; using threads.")
+
+    workers = min(_HEADSHOT_FETCH_WORKERS, len(urls))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {url: pool.submit(_fetch_headshot_page, url) for url in urls}
+        for url, future in futures.items():
+            try:
+                yield url, future.result()
+            except Exception as exc:
+                yield url, exc
+
+
 def _download_headshots_for_targets(state, targets):
     """Attempt to download headshots for people who need them."""
 
@@ -1036,36 +1391,50 @@ def _download_headshots_for_targets(state, targets):
     print("🖼️  HEADSHOT SCRAPE")
     print("=" * 60)
 
-    page_cache = {}
+    # Fetch every page concurrently; results are collected in list order.
+    # "https://x/foo" and "https://X/foo/" are the same page, fetch it once.
+    unique_urls = []
+    seen_fetch = set()
     for url in existing_urls:
-        try:
-            if url in page_cache:
-                continue
-            print(f"🔍 Fetching {url} ...")
-            page = session.get(url, timeout=5)
-            page.raise_for_status()
-            html = page.text  # let Requests handle decoding
-
-            # Some endpoints (or intermediaries) may percent-encode the HTML (!)
-            if html.lstrip().startswith("%3c") or html.lstrip().lower().startswith(
-                "%3c!doctype"
-            ):
-                try:
-                    html = unquote(html)
-                except Exception:
-                    pass
-
-            soup = BeautifulSoup(html, "html.parser")
-            page_cache[url] = (soup, page)
-        except (
-            Exception
-        ) as exc:  # pragma: no cover - network errors only shown at runtime
-            print(f"⚠️  Failed to fetch {url}: {exc}")
+        key = _fetch_key(url)
+        if key not in seen_fetch:
+            seen_fetch.add(key)
+            unique_urls.append(url)
+    for url in unique_urls:
+        print(f"🔍 Fetching {url} ...")
+
+    page_cache = {}
+    for url, result in _fetch_headshot_pages(state, unique_urls):
+        if isinstance(result, BaseException):
+            print(f"⚠️  Failed to fetch {url}: {result}")
+            continue
+        if result is not None:
+            # Key by the final URL so aliases that redirect to one page merge
+            page_cache.setdefault(_fetch_key(result[1] or url), result)
 
     if not page_cache:
         print("❌ Unable to fetch any EXISTING_URLS; skipping headshot scrape.")
         return
 
+    # Walk each page's <img> tags once; targets then scan this flat list.
+    # (src, alt) pairs are deduped here so the per-target scan needs no set.
+    img_index = []
+    seen_imgs = set()
+    for soup, page_url in page_cache.values():
+        for img in soup.find_all("img"):
+            alt = img.get("alt")
+            if not alt:
+                continue
+            alt_norm = _normalize_for_match(alt)
+            src = img.get("src") or ""
+            if not alt_norm or not src:
+                continue
+            absolute_src = urljoin(page_url, src)
+            if (absolute_src, alt) in seen_imgs:
+                continue
+            seen_imgs.add((absolute_src, alt))
+            img_index.append((absolute_src, alt, alt_norm))
+
     headshots_dir = Path("headshots")
     headshots_dir.mkdir(exist_ok=True)
 
@@ -1073,14 +1442,20 @@ def _download_headshots_for_targets(state, targets):
         def clean(part: Optional[str]) -> str:
             if not part:
                 return ""
-            normalized = unicodedata.normalize("NFKD", part)
-            ascii_part = normalized.encode("ascii", "ignore").decode("ascii")
-            return re.sub(r"[^a-z0-9]+", "-", ascii_part.lower()).strip("-")
+            if part.isascii():
+                ascii_part = part
+            else:
+                normalized = unicodedata.normalize("NFKD", part)
+                ascii_part = normalized.encode("ascii", "ignore").decode("ascii")
+            return _SLUG_RE.sub("-", ascii_part.lower()).strip("-")
 
         pieces = [clean(last), clean(first)]
         joined = "-".join([p for p in pieces if p])
         return joined or "headshot"
 
+    # Per target: display name, output stem and the candidates not offered
+    # yet, so a failed or declined save falls back to the next candidate
+    pending = []  # (name_display, filename_stem, candidate iterator)
     for target in targets:
         first = target.get("first", "")
         last = target.get("last", "")
@@ -1092,25 +1467,11 @@ def _download_headshots_for_targets(state, targets):
             print(f"⚠️  Skipping {name_display}: no last name available for matching.")
             continue
 
-        matches = []
-        seen = set()
-        for _, (soup, response) in page_cache.items():
-            for img in soup.find_all("img"):
-                alt = img.get("alt")
-                if not alt:
-                    continue
-                alt_norm = _normalize_for_match(alt)
-                if not alt_norm or last_norm not in alt_norm:
-                    continue
-                src = img.get("src") or ""
-                if not src:
-                    continue
-                absolute_src = urljoin(response.url, src)
-                key = (absolute_src, alt)
-                if key in seen:
-                    continue
-                seen.add(key)
-                matches.append({"src": absolute_src, "alt": alt})
+        matches = [
+            {"src": absolute_src, "alt": alt}
+            for absolute_src, alt, alt_norm in img_index
+            if last_norm in alt_norm
+        ]
 
         if not matches:
             print(f"⚠️  No matching headshot found for {name_display}.")
@@ -1121,66 +1482,100 @@ def _download_headshots_for_targets(state, targets):
         if not filename_stem.endswith("_SC"):
             filename_stem = f"{filename_stem}_SC"
 
-        for match in matches:
+        pending.append((name_display, filename_stem, iter(matches)))
+
+    def pick(entry):
+        """Offer ``entry``'s remaining candidates; the chosen src, or None."""
+        name_display, _, candidates = entry
+        for match in candidates:
             src = match["src"]
             alt = match.get("alt") or "(no alt)"
             print("\nFound candidate image for", name_display)
             print(f"  Alt: {alt}")
             print(f"  Src: {src}")
 
-            try:
-                choice = input("Save this image? [Y/n]: ").strip().lower()
-            except KeyboardInterrupt:
-                print("\n↪️  Headshot scraping cancelled by user.")
-                return
-
+            choice = input("Save this image? [Y/n]: ").strip().lower()
             if choice not in ("", "y", "yes"):
                 print("↪️  Skipping this image.")
                 continue
-
-            try:
-                with session.get(src, timeout=5) as response:
-                    response.raise_for_status()
-            except requests.RequestException as exc:
-                print(f"❌ Failed to download image: {exc}")
-                continue
-
-            ext = os.path.splitext(urlparse(src).path)[1]
-            if not ext:
-                content_type = (response.headers.get("Content-Type") or "").lower()
-                if "png" in content_type:
-                    ext = ".png"
-                elif "gif" in content_type:
-                    ext = ".gif"
-                elif "webp" in content_type:
-                    ext = ".webp"
+            return src
+        print(f"⚠️  No image saved for {name_display}.")
+        return None
+
+    def pick_all(entries):
+        picks = []
+        for entry in entries:
+            src = pick(entry)
+            if src is not None:
+                picks.append((entry, src))
+        return picks
+
+    # Collect the user's picks up front so the downloads can run in parallel;
+    # each round downloads the picks, moves them into place, and re-prompts
+    # the targets whose save failed or was declined
+    futures = []
+    try:
+        picks = pick_all(pending)
+        while picks:
+            # Downloads stream into <stem><ext>.part, so picks sharing a stem
+            # must not run together; the later ones wait for the next round
+            batch, deferred, stems = [], [], set()
+            for entry, src in picks:
+                if entry[1] in stems:
+                    deferred.append((entry, src))
                 else:
-                    ext = ".jpg"
+                    stems.add(entry[1])
+                    batch.append((entry, src))
+
+            print(f"\n⬇️  Downloading {len(batch)} headshot(s) ...")
+            workers = min(_HEADSHOT_DOWNLOAD_WORKERS, len(batch))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_download_headshot, src, headshots_dir, entry[1])
+                    for entry, src in batch
+                ]
+
+            retry = [
+                entry
+                for (entry, _), future in zip(batch, futures)
+                if not _save_downloaded_headshot(entry[0], future)
+            ]
+            futures = []
+            picks = deferred + pick_all(retry)
+    except KeyboardInterrupt:
+        print("\n↪️  Headshot scraping cancelled by user.")
+        for leftover in futures:
+            if leftover.exception() is None:
+                _part_path(leftover.result()).unlink(missing_ok=True)
 
-            output_path = headshots_dir / f"{filename_stem}{ext}"
 
-            if output_path.exists():
-                try:
-                    overwrite = (
-                        input(f"⚠️  {output_path} exists. Overwrite? [y/N]: ")
-                        .strip()
-                        .lower()
-                    )
-                except KeyboardInterrupt:
-                    print("\n↪️  Headshot scraping cancelled by user.")
-                    return
-                if overwrite not in ("y", "yes"):
-                    print("↪️  Keeping existing file; skipping save.")
-                    continue
+def _save_downloaded_headshot(name_display, future) -> bool:
+    """Move a finished download into place, asking before overwriting.
 
-            try:
-                with open(output_path, "wb") as fh:
-                    fh.write(response.content)
-                print(f"✅ Saved headshot to {output_path}")
-            except OSError as exc:
-                print(f"❌ Failed to write {output_path}: {exc}")
-                continue
+    Returns True once the image is saved; False when the download or the
+    save failed, or the user kept the existing file.
+    """
+    exc = future.exception()
+    if exc is not None:
+        print(f"❌ Failed to download image for {name_display}: {exc}")
+        return False
 
-            break
-        else:
-            print(f"⚠️  No image saved for {name_display}.")
+    output_path = future.result()
+    part_path = _part_path(output_path)
+    if output_path.exists():
+        overwrite = (
+            input(f"⚠️  {output_path} exists. Overwrite? [y/N]: ").strip().lower()
+        )
+        if overwrite not in ("y", "yes"):
+            print("↪️  Keeping existing file; skipping save.")
+            part_path.unlink(missing_ok=True)
+            return False
+
+    try:
+        os.replace(part_path, output_path)
+    except OSError as exc:
+        part_path.unlink(missing_ok=True)
+        print(f"❌ Failed to write {output_path}: {exc}")
+        return False
+    print(f"✅ Saved headshot to {output_path}")
+    return True
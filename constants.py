@@ -1,6 +1,3 @@
-from commands.show import cmd_show
-
-
 DOMAINS = [
     {
         "full_name": "Enterprise",
@@ -122,6 +119,32 @@ DOMAIN_MAPPING = {
     domain["url"]: domain["sitecore_domain_name"] for domain in DOMAINS if domain["url"]
 }
 
+# Extra DSM worksheets searched by lookup_link_in_dsm that aren't real domains
+BONUS_DOMAINS = [
+    {
+        "full_name": "News Content",
+        "worksheet_name": "News Content",
+        "sitecore_domain_name": "none_defined",
+        "url": "example.com",
+        "worksheet_header_row": 0,
+        "existing_url_col_name": "Current URLs",
+        "proposed_url_col_name": "Path",
+    }
+]
+
+# (worksheet_name, header_row, existing_url_col, proposed_url_col, full_name)
+# for every sheet lookup_link_in_dsm searches, in search order
+DOMAIN_SEARCH_PLAN = [
+    (
+        d.get("worksheet_name", d["full_name"]),
+        d.get("worksheet_header_row", 4),
+        d.get("existing_url_col_name", "EXISTING URL"),
+        d.get("proposed_url_col_name", "PROPOSED URL"),
+        d["full_name"],
+    )
+    for d in DOMAINS + BONUS_DOMAINS
+]
+
 
 def get_commands(state):
     """Build a minimal mapping of command names to handlers."""
@@ -133,6 +156,7 @@ def get_commands(state):
     from commands.core import cmd_open, cmd_debug
     from commands.history import cmd_history
     from commands.person import cmd_person
+    from commands.show import cmd_show
 
     return {
         "bulk_check": lambda args: cmd_bulk_check(args, state),
@@ -2,25 +2,38 @@
 DSM/Spreadsheet utilities for People Card CLI.
 """
 
+import importlib.util
 import os
 import re
-import glob
+import shutil
 from urllib.parse import urlparse
 import pandas as pd
 from pathlib import Path
 
-from constants import DOMAINS
+from constants import DOMAIN_SEARCH_PLAN
 
 from utils.core import debug_print
 
 DSM_DIR = Path(".")
+# Parsed worksheets are kept here as parquet when pyarrow is installed
+DSM_PARQUET_CACHE_DIR = Path("migration_cache") / "dsm"
+
+_URL_RE = re.compile(r"https?://[^\s,;]+", re.IGNORECASE)
+_DSM_FNAME_RE = re.compile(r"dsm-(\d{4})\.xlsx")
 
 
 def get_latest_dsm_file():
     pattern = str(DSM_DIR / "dsm-*.xlsx")
-    files = glob.glob(pattern)
-
     debug_print(f"Searching for DSM files with pattern: {pattern}")
+
+    # One directory pass; the prefix/suffix test is the same one the old
+    # glob pattern applied, and is checked before the regex
+    with os.scandir(DSM_DIR) as entries:
+        files = [
+            str(DSM_DIR / entry.name)
+            for entry in entries
+            if entry.name.startswith("dsm-") and entry.name.endswith(".xlsx")
+        ]
     debug_print(f"Found files: {files}")
 
     latest = None
@@ -28,7 +41,7 @@ def get_latest_dsm_file():
 
     for f in files:
         basename = os.path.basename(f)
-        m = re.match(r"dsm-(\d{4})\.xlsx", basename)
+        m = _DSM_FNAME_RE.match(basename)
 
         if m:
             dt = m.group(1)
@@ -50,13 +63,98 @@ def get_latest_dsm_file():
 
 def load_spreadsheet(path):
     debug_print(f"Loading spreadsheet: {path}")
-    return pd.ExcelFile(path)
+    if importlib.util.find_spec("pyarrow") is None:
+        return pd.ExcelFile(path)
 
+    cache_dir = _parquet_cache_dir(path)
+    if cache_dir.is_dir():
+        # This exact file (same mtime and size) was opened before; sheets it
+        # parsed then are read back from parquet without touching the xlsx
+        debug_print(f"Using parquet cache: {cache_dir}")
+        return ParquetCachedExcelFile(path, cache_dir)
 
-def get_column_value(sheet_df, excel_row, column_name):
-    df_idx = excel_row
+    excel = pd.ExcelFile(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _remove_stale_parquet_caches(path, cache_dir)
+    return ParquetCachedExcelFile(path, cache_dir, excel)
+
+
+def _parquet_cache_dir(path):
+    stat = os.stat(path)
+    name = f"{Path(path).stem}-{stat.st_mtime_ns}-{stat.st_size}"
+    return DSM_PARQUET_CACHE_DIR / name
+
+
+def _remove_stale_parquet_caches(path, keep):
+    """Delete parquet caches of earlier versions of ``path``."""
+    stale_re = re.compile(re.escape(Path(path).stem) + r"-\d+-\d+")
+    for entry in DSM_PARQUET_CACHE_DIR.iterdir():
+        if entry != keep and entry.is_dir() and stale_re.fullmatch(entry.name):
+            try:
+                shutil.rmtree(entry)
+            except OSError as e:
+                debug_print(f"Could not remove stale parquet cache {entry}: {e}")
+
+
+class ParquetCachedExcelFile:
+    """``pd.ExcelFile`` stand-in that keeps parsed sheets as parquet files.
+
+    Each ``parse(sheet_name, header=...)`` result is written to
+    ``<cache_dir>/<sheet>__h<header>.parquet`` the first time it is parsed
+    from the workbook and read back from there afterwards. The workbook
+    itself is only opened on a cache miss. Frames that parquet can't hold
+    (e.g. mixed-type object columns) simply aren't cached.
+    """
+
+    def __init__(self, path, cache_dir, excel=None):
+        self.path = path
+        self.cache_dir = Path(cache_dir)
+        self._excel = excel
+
+    def parse(self, sheet_name, header=0):
+        cached = self.cache_dir / f"{sheet_name}__h{header}.parquet"
+        if cached.exists():
+            try:
+                return pd.read_parquet(cached)
+            except Exception as e:
+                debug_print(f"Ignoring unreadable parquet cache {cached}: {e}")
 
-    target_col = next(
+        if self._excel is None:
+            self._excel = pd.ExcelFile(self.path)
+        df = self._excel.parse(sheet_name, header=header)
+        try:
+            df.to_parquet(cached)
+        except Exception as e:
+            debug_print(f"Not caching sheet '{sheet_name}' as parquet: {e}")
+            cached.unlink(missing_ok=True)
+        return df
+
+
+def parse_sheet(excel_data, sheet_name, header, state=None):
+    """Parse a DSM worksheet, reusing the DataFrame cached on ``state``.
+
+    The cache is keyed by ``(sheet_name, header)`` and is dropped whenever
+    ``excel_data`` is no longer the workbook it was built from.
+    """
+    if state is None:
+        return excel_data.parse(sheet_name, header=header)
+
+    if state.dsm_sheet_cache_source is not excel_data:
+        state.dsm_sheet_cache = {}
+        state.dsm_sheet_cache_source = excel_data
+
+    key = (sheet_name, header)
+    df = state.dsm_sheet_cache.get(key)
+    if df is None:
+        debug_print(f"Parsing worksheet '{sheet_name}' (header row {header})")
+        df = excel_data.parse(sheet_name, header=header)
+        state.dsm_sheet_cache[key] = df
+    return df
+
+
+def _find_column(sheet_df, column_name):
+    """Return the sheet's header matching ``column_name`` (trimmed, any case)."""
+    return next(
         (
             c
             for c in sheet_df.columns
@@ -65,14 +163,19 @@ def get_column_value(sheet_df, excel_row, column_name):
         None,
     )
 
+
+def get_column_value(sheet_df, excel_row, column_name):
+    df_idx = excel_row
+
+    target_col = _find_column(sheet_df, column_name)
+
     if not target_col:
         debug_print(f"Column '{column_name}' not found in sheet")
         return ""
 
     try:
         row = sheet_df.iloc[df_idx]
-        value = row[target_col]
-        return str(value) if pd.notna(value) else ""
+        return _cell_str(row[target_col])
 
     except IndexError:
         debug_print(f"Row index {df_idx} out of range")
@@ -107,12 +210,21 @@ def get_existing_urls(sheet_df, excel_row, col_name="EXISTING URL"):
         no URLs are present.
     """
 
-    raw_value = get_column_value(sheet_df, excel_row, col_name)
+    return _urls_from_cell(get_column_value(sheet_df, excel_row, col_name))
+
+
+def _cell_str(value):
+    """Render a DSM cell the way ``get_column_value`` does (NaN -> "")."""
+    return str(value) if pd.notna(value) else ""
+
+
+def _urls_from_cell(raw_value):
+    """Split an ``EXISTING URL`` cell's text into its URLs."""
     if not raw_value:
         return []
 
     value = str(raw_value)
-    matches = re.findall(r"https?://[^\s,;]+", value, flags=re.IGNORECASE)
+    matches = _URL_RE.findall(value)
     if matches:
         return [m.strip() for m in matches]
 
@@ -148,6 +260,102 @@ def count_http(url):
     return cnt
 
 
+def _has_space(text):
+    return any(ch.isspace() for ch in text)
+
+
+def _url_index_key(token):
+    key = token.lower()
+    return key[:-1] if key.endswith("/") else key
+
+
+def _build_url_index(excel_data, state):
+    """Map every URL in the DSM to where ``lookup_link_in_dsm`` would find it.
+
+    Keys are lowercased with one trailing slash dropped, mirroring the
+    lookup regex. The first sheet/row in search order wins, as in a full
+    scan. Returns ``(index, exact)``; ``exact`` is False when some cell
+    text is non-ASCII, where case-insensitive regex matching can differ
+    from ``str.lower``, so a miss must be confirmed by scanning.
+    """
+    index = {}
+    exact = True
+    for (
+        worksheet_name,
+        header_row,
+        existing_url_col_name,
+        proposed_url_col_name,
+        full_name,
+    ) in DOMAIN_SEARCH_PLAN:
+        try:
+            df = parse_sheet(excel_data, worksheet_name, header_row, state)
+            existing_col = _find_column(df, existing_url_col_name)
+            if existing_col is None:
+                continue
+            proposed_col = _find_column(df, proposed_url_col_name)
+
+            for excel_row, value in enumerate(df[existing_col].tolist()):
+                for url in _urls_from_cell(_cell_str(value)):
+                    # Cells without http URLs are kept whole; the lookup regex
+                    # then matches whitespace-separated pieces of them
+                    for token in url.split():
+                        if not token.isascii():
+                            exact = False
+                        key = _url_index_key(token)
+                        if key in index:
+                            continue
+                        proposed_url = (
+                            _cell_str(df[proposed_col].iat[excel_row])
+                            if proposed_col is not None
+                            else ""
+                        )
+                        index[key] = (full_name, excel_row, url, proposed_url)
+        except Exception as e:
+            debug_print(f"Error indexing domain {full_name}: {e}")
+            continue
+
+    debug_print(f"Indexed {len(index)} DSM URL(s)")
+    return index, exact
+
+
+def _get_url_index(excel_data, state):
+    """Return the URL index for ``excel_data``, building it on first use."""
+    if state.dsm_url_index_source is not excel_data:
+        state.dsm_url_index = _build_url_index(excel_data, state)
+        state.dsm_url_index_source = excel_data
+    return state.dsm_url_index
+
+
+def _match_result(full_name, excel_row, matched_url, proposed_url):
+    debug_print(f"Found match! Proposed URL: {proposed_url}")
+
+    # Generate the proposed hierarchy using existing functions
+    try:
+        from utils.sitecore import get_sitecore_root
+
+        root = get_sitecore_root(matched_url)
+    except ImportError:
+        root = "Sites"  # Default fallback
+
+    proposed_segments = (
+        [seg for seg in proposed_url.strip("/").split("/") if seg]
+        if proposed_url
+        else []
+    )
+
+    return {
+        "found": True,
+        "domain": full_name,
+        "row": excel_row,
+        "existing_url": matched_url,
+        "proposed_url": proposed_url,
+        "proposed_hierarchy": {
+            "root": root,
+            "segments": proposed_segments,
+        },
+    }
+
+
 def lookup_link_in_dsm(link_url, excel_data=None, state=None):
     """Locate a link's destination within the DSM spreadsheet.
 
@@ -196,82 +404,71 @@ def lookup_link_in_dsm(link_url, excel_data=None, state=None):
 
     debug_print(f"🔎🔠 Using regex pattern for lookup: {url_pattern}")
 
-    bonus_domains = [
-        {
-            "full_name": "News Content",
-            "worksheet_name": "News Content",
-            "sitecore_domain_name": "none_defined",
-            "url": "example.com",
-            "worksheet_header_row": 0,
-        }
-    ]
-
-    for domain in DOMAINS + bonus_domains:
+    if (
+        state is not None
+        and normalized_link.isascii()
+        and not _has_space(normalized_link)
+    ):
+        index, exact = _get_url_index(excel_data, state)
+        hit = index.get(normalized_link.lower())
+        if hit is not None:
+            return _match_result(*hit)
+        if exact:
+            debug_print("Link not found in any domain")
+            return {"found": False}
+        # Some DSM cells hold non-ASCII text the index can't rule out
+        debug_print("URL index miss is not conclusive; scanning sheets")
+
+    url_re = re.compile(url_pattern, re.IGNORECASE)
+    # Any cell that can match must contain the link itself; this looser
+    # pattern lets pandas pick out candidate rows without a Python loop
+    link_re = re.compile(re.escape(normalized_link), re.IGNORECASE)
+
+    for (
+        worksheet_name,
+        header_row,
+        existing_url_col_name,
+        proposed_url_col_name,
+        full_name,
+    ) in DOMAIN_SEARCH_PLAN:
         try:
-            df = excel_data.parse(
-                domain.get("worksheet_name", domain["full_name"]),
-                header=domain.get("worksheet_header_row", 4),
-            )
+            df = parse_sheet(excel_data, worksheet_name, header_row, state)
 
-            existing_url_col_name = domain.get("existing_url_col_name", "EXISTING URL")
-            proposed_url_col_name = domain.get("proposed_url_col_name", "PROPOSED URL")
-
-            # Search through all rows in this domain
-            for idx in range(len(df)):
-                excel_row = idx
-                if domain["full_name"].lower() == "news content":
-                    existing_url_col_name = "Current URLs"
-                    proposed_url_col_name = "Path"
-
-                existing_urls = get_existing_urls(df, excel_row, existing_url_col_name)
+            # Resolve both headers once per sheet, then index cells directly
+            existing_col = _find_column(df, existing_url_col_name)
+            if existing_col is None:
+                continue
+            proposed_col = _find_column(df, proposed_url_col_name)
+            existing_values = df[existing_col]
+            candidates = existing_values.astype(str).str.contains(link_re, na=False)
+
+            # Only the candidate rows get the exact per-URL check
+            for excel_row in candidates.to_numpy().nonzero()[0].tolist():
+                existing_urls = _urls_from_cell(
+                    _cell_str(existing_values.iat[excel_row])
+                )
 
                 if not existing_urls:
                     continue
 
                 # Use regex to check if the target URL exists anywhere in the cell
                 matched_url = next(
-                    (
-                        u
-                        for u in existing_urls
-                        if re.search(url_pattern, u, re.IGNORECASE)
-                    ),
+                    (u for u in existing_urls if url_re.search(u)),
                     None,
                 )
 
                 if matched_url:
-                    proposed_url = get_proposed_url(
-                        df, excel_row, proposed_url_col_name
+                    proposed_url = (
+                        _cell_str(df[proposed_col].iat[excel_row])
+                        if proposed_col is not None
+                        else ""
                     )
-                    debug_print(f"Found match! Proposed URL: {proposed_url}")
-
-                    # Generate the proposed hierarchy using existing functions
-                    try:
-                        from utils.sitecore import get_sitecore_root
-
-                        root = get_sitecore_root(matched_url)
-                    except ImportError:
-                        root = "Sites"  # Default fallback
-
-                    proposed_segments = (
-                        [seg for seg in proposed_url.strip("/").split("/") if seg]
-                        if proposed_url
-                        else []
+                    return _match_result(
+                        full_name, excel_row, matched_url, proposed_url
                     )
 
-                    return {
-                        "found": True,
-                        "domain": domain["full_name"],
-                        "row": excel_row,
-                        "existing_url": matched_url,
-                        "proposed_url": proposed_url,
-                        "proposed_hierarchy": {
-                            "root": root,
-                            "segments": proposed_segments,
-                        },
-                    }
-
         except Exception as e:
-            debug_print(f"Error searching domain {domain}: {e}")
+            debug_print(f"Error searching domain {full_name}: {e}")
             continue
 
     debug_print("Link not found in any domain")
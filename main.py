@@ -13,6 +13,7 @@ from data.dsm import (
 )
 from utils.scraping import (
     check_status_code,
+    close_session,
 )
 import requests
 from bs4 import BeautifulSoup
@@ -92,6 +93,21 @@ def main():
         action="store_true",
         help="Include sidebar in page extraction",
     )
+    parser.add_argument(
+        "--async",
+        dest="async_fetch",
+        action="store_true",
+        help=(
+            "Use aiohttp for network work: headshot pages in scan, link status "
+            "checks, and fetching several page URLs at once (requires aiohttp)"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Always refetch page HTML and link statuses instead of using the caches",
+    )
     parser.set_defaults(debug=False)
     args = parser.parse_args()
 
@@ -100,6 +116,7 @@ def main():
 
     # Register cleanup function to save history on exit
     atexit.register(cleanup_history)
+    atexit.register(close_session)
 
     # Set debug mode in utils
     set_debug(args.debug, state)
@@ -114,6 +131,10 @@ def main():
         debug_print("Include sidebar: TRUE")
     else:
         state.set_variable("INCLUDE_SIDEBAR", "false")
+    if args.async_fetch:
+        state.set_variable("ASYNC_FETCH", "true")
+    if args.no_cache:
+        state.set_variable("NO_CACHE", "true")
 
     # Try to auto-load the latest DSM file
     dsm_file = get_latest_dsm_file()
@@ -158,37 +179,45 @@ def main():
             break
 
 
+def _informational_prompt_context():
+    cached = state.prompt_cache
+    if cached is not None:
+        return cached
+
+    variables = state.variables
+    domain = variables.get("DOMAIN", "")
+    row = variables.get("ROW", "")
+    include_sidebar = state.boolean_values["INCLUDE_SIDEBAR"]
+    debug = state.boolean_values["DEBUG"]
+    cache_file = variables.get("CACHE_FILE", "")
+    debug_print(
+        f"Generating prompt context: domain={domain}, row={row}, "
+        f"include_sidebar={include_sidebar}, debug={debug}, cache_file={cache_file}"
+    )
+
+    primary_context = f"{domain}-{row}" if domain and row else "~"
+    c1 = " 🖼️" if include_sidebar else " 🪟"
+    c2 = " 🐛" if debug else " 🐞"
+    c3 = " 💾" if cache_file else " 📂"
+    state.prompt_cache = f"[{primary_context}{c1}{c2}{c3}]"
+    return state.prompt_cache
+
+
+def _url_prompt_context():
+    url = state.get_variable("URL")
+    return f"[{url[:30]}...]" if url else "[~]"
+
+
+_PROMPT_CONTEXT_BUILDERS = {
+    "informational": _informational_prompt_context,
+    "url": _url_prompt_context,
+}
+
+
 def generate_prompt_context(kind="url"):
     """Generate context for the command prompt based on current state."""
-    match kind:
-        case "informational":
-            domain = state.get_variable("DOMAIN")
-            row = state.get_variable("ROW")
-            include_sidebar = state.get_variable("INCLUDE_SIDEBAR")
-            debug = state.get_variable("DEBUG")
-            cache_file = state.get_variable("CACHE_FILE")
-            debug_print(
-                f"Generating prompt context: domain={domain}, row={row}, "
-                f"include_sidebar={include_sidebar}, debug={debug}, cache_file={cache_file}"
-            )
-
-            primary_context = f"{domain}-{row}" if domain and row else "~"
-            c1 = " 🖼️" if include_sidebar else " 🪟"
-            c2 = " 🐛" if debug else " 🐞"
-            c3 = " 💾" if cache_file else " 📂"
-            return f"[{primary_context}{c1}{c2}{c3}]"
-        case "url":
-            url = state.get_variable("URL")
-            return f"[{url[:30]}...]" if url else "[~]"
-        case _:
-            return "[~]"
-    # if kind == "url":
-    #     return (
-    #         f"({state.get_variable('URL')[:30]}...)"
-    #         if state.get_variable("URL")
-    #         else "(~)"
-    #     )
-    # return "(~)"
+    builder = _PROMPT_CONTEXT_BUILDERS.get(kind)
+    return builder() if builder else "[~]"
 
 
 if __name__ == "__main__":
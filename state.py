@@ -5,6 +5,12 @@ State management for People Card CLI.
 import re
 from utils.core import debug_print
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value):
+    return isinstance(value, str) and value.lower() in _TRUE_VALUES
+
 
 class CLIState:
     """Global state manager for the CLI application."""
@@ -25,33 +31,58 @@ class CLIState:
             "DEBUG": "false",
             "TAXONOMY": "",
             "EXTRACTED_PEOPLE_LIST": "",
+            "ASYNC_FETCH": "false",
+            "NO_CACHE": "false",
         }
         self.excel_data = None
+        # Parsed DSM worksheets keyed by (sheet_name, header_row); see
+        # data.dsm.parse_sheet. Reset whenever excel_data changes.
+        self.dsm_sheet_cache = {}
+        self.dsm_sheet_cache_source = None
+        # (index, exact) from data.dsm._build_url_index for dsm_url_index_source
+        self.dsm_url_index = ({}, True)
+        self.dsm_url_index_source = None
         self.current_page_data = None
+        # Rendered "informational" prompt prefix; cleared on any variable write.
+        self.prompt_cache = None
 
         # New containers for scan/export workflow
-        self.scan_pct_map = {}  # (first_lower,last_lower) -> set of PCT raw keys
+        self.scan_pct_map = {}  # (first_lower,last_lower) -> list of PCT raw keys
         self.scan_original_fullnames = []  # list of original full name strings
         self.scan_export_rows = []  # list of dict rows ready for export
 
         # Variables that should be returned as booleans
-        self.boolean_variables = {"INCLUDE_SIDEBAR", "DEBUG"}
+        self.boolean_variables = {"INCLUDE_SIDEBAR", "DEBUG", "ASYNC_FETCH", "NO_CACHE"}
+        # Parsed values of boolean_variables, refreshed by set_variable; the
+        # raw strings stay in self.variables for display and validation
+        self.boolean_values = {
+            name: _parse_bool(self.variables[name]) for name in self.boolean_variables
+        }
 
         self.valid_variable_formats = {
             "URL": r"^https?://",
             "INCLUDE_SIDEBAR": r"^(true|false)$",
+            "ASYNC_FETCH": r"^(true|false)$",
+            "NO_CACHE": r"^(true|false)$",
             "DSM_FILE": r"^[\w\-. ]+\.xlsx$",
             "CACHE_FILE": r"^[\w\-. ]+\.json$",
         }
+        self.compiled_variable_formats = {
+            name: re.compile(pattern)
+            for name, pattern in self.valid_variable_formats.items()
+        }
 
     def set_variable(self, name, value):
         name = name.upper()
         if name in self.variables:
             old_value = self.variables[name]
+            self.prompt_cache = None
             if isinstance(value, (list, dict)):
                 self.variables[name] = value
             else:
                 self.variables[name] = str(value) if value is not None else ""
+            if name in self.boolean_variables:
+                self.boolean_values[name] = _parse_bool(self.variables[name])
             debug_print(
                 f"❤️Variable {name} changed from '{old_value}' to '{self.variables[name]}'"
             )
@@ -62,13 +93,25 @@ class CLIState:
 
     def get_variable(self, name):
         name = name.upper()
-        value = self.variables.get(name, "")
 
-        # Convert boolean variables to actual booleans
-        if name in self.boolean_variables:
-            return value.lower() in ["true", "1", "yes", "on"]
+        # Boolean variables come back as actual booleans, parsed at set time
+        if name in self.boolean_values:
+            return self.boolean_values[name]
+
+        return self.variables.get(name, "")
 
-        return value
+    def get_variables(self, *names):
+        """Get several variables at once, as a tuple in the order given."""
+        booleans = self.boolean_values
+        variables = self.variables
+        values = []
+        for name in names:
+            name = name.upper()
+            if name in booleans:
+                values.append(booleans[name])
+            else:
+                values.append(variables.get(name, ""))
+        return tuple(values)
 
     def get_raw_variable(self, name):
         """Get the raw string value without boolean conversion."""
@@ -95,10 +138,9 @@ class CLIState:
             if not self.get_raw_variable(var):
                 missing.append(var)
 
-            if var in self.valid_variable_formats:
-                if not re.match(
-                    self.valid_variable_formats[var], self.get_raw_variable(var)
-                ):
+            pattern = self.compiled_variable_formats.get(var)
+            if pattern is not None:
+                if not pattern.match(self.get_raw_variable(var)):
                     invalid.append(var)
 
         if missing:
@@ -120,4 +162,5 @@ class CLIState:
         self.variables["PROPOSED_PATH"] = ""
         self.variables["TAXONOMY"] = ""
         self.variables["EXTRACTED_PEOPLE_LIST"] = ""
+        self.prompt_cache = None
         debug_print("Variables reset to defaults.")
@@ -0,0 +1,99 @@
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+import utils.scraping as scraping
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _status(self):
+        return 404 if self.path.startswith("/missing") else 200
+
+    def do_HEAD(self):
+        self.send_response(405 if self.path == "/no-head" else self._status())
+        self.end_headers()
+
+    def do_GET(self):
+        n = self.path.strip("/")
+        body = (
+            f'<html><head><meta name="description" content="d{n}"></head>'
+            f'<body><div id="main"><a href="/x{n}">x</a>'
+            f'<a href="/missing.pdf">p</a></div></body></html>'
+        ).encode()
+        self.send_response(self._status())
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base_url(monkeypatch, tmp_path):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    monkeypatch.setattr(scraping, "STATUS_CACHE_FILE", tmp_path / "status.json")
+    monkeypatch.setattr(scraping, "_status_cache", None)
+    monkeypatch.setattr(scraping, "_PAGE_HTML_TTL", 0)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def _status_urls(base_url):
+    return [f"{base_url}/ok", f"{base_url}/missing", f"{base_url}/no-head", "/rel"]
+
+
+def test_status_checks_fall_back_to_threads_without_aiohttp(monkeypatch, base_url):
+    monkeypatch.setattr(scraping, "aiohttp", None)
+
+    statuses = scraping._check_status_codes(_status_urls(base_url), async_fetch=True)
+
+    assert list(statuses.values()) == ["200", "404", "200", "0"]
+
+
+def test_async_status_checks_match_threaded_checks(base_url):
+    if scraping.aiohttp is None:
+        pytest.skip("aiohttp is not installed")
+    urls = _status_urls(base_url)
+
+    results = asyncio.run(scraping._check_status_codes_async(urls))
+
+    assert results == [scraping.check_status_code(url) for url in urls]
+
+
+def _page_urls(base_url):
+    return [f"{base_url}/1", f"{base_url}/2", f"{base_url}/missing-page"]
+
+
+def _without_error_text(page):
+    return {k: v for k, v in page.items() if k != "error"}, "error" in page
+
+
+def test_retrieve_pages_is_sequential_without_aiohttp(monkeypatch, base_url):
+    monkeypatch.setattr(scraping, "aiohttp", None)
+
+    pages = scraping.retrieve_pages(_page_urls(base_url), async_fetch=True)
+
+    assert pages[0]["meta_description"] == "d1"
+    assert pages[0]["links"] == [("x", f"{base_url}/x1", "200")]
+    assert pages[0]["pdfs"] == [("p", f"{base_url}/missing.pdf", "404")]
+    assert "error" in pages[2] and pages[2]["links"] == []
+
+
+def test_concurrent_retrieval_matches_sequential(base_url):
+    if scraping.aiohttp is None:
+        pytest.skip("aiohttp is not installed")
+    urls = _page_urls(base_url)
+
+    sequential = scraping.retrieve_pages(urls)
+    concurrent = asyncio.run(scraping.retrieve_page_data_many(urls))
+
+    assert list(concurrent) == urls
+    assert [_without_error_text(p) for p in concurrent.values()] == [
+        _without_error_text(p) for p in sequential
+    ]
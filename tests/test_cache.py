@@ -0,0 +1,116 @@
+import json
+import os
+
+import utils.cache as cache
+from state import CLIState
+
+PAGE = {"links": [], "meta_description": "", "meta_robots": ""}
+
+
+def _use_tmp_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "URL_INDEX_FILE", tmp_path / "_url_index.json")
+    monkeypatch.setattr(cache, "_url_index", None)
+    monkeypatch.setattr(cache, "_url_index_mtime", None)
+
+
+def _state(domain="", row=""):
+    state = CLIState()
+    state.set_variable("DOMAIN", domain)
+    state.set_variable("ROW", row)
+    return state
+
+
+def test_cached_url_is_found_through_the_index(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    cache._cache_page_data(_state("Enterprise", "23"), "https://a.test/p", PAGE)
+
+    assert cache.read_json(tmp_path / "_url_index.json") == {
+        "https://a.test/p": "page_check_Enterprise-23.json"
+    }
+    # A hit is answered without scanning the cache directory
+    monkeypatch.setattr(type(tmp_path), "glob", None)
+    assert cache._find_cache_file_for_url("https://a.test/p") == str(
+        tmp_path / "page_check_Enterprise-23.json"
+    )
+
+
+def test_missing_index_is_rebuilt_by_a_scan(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    cache._cache_page_data(_state(), "https://a.test/one", PAGE)
+    cache._cache_page_data(_state(), "https://a.test/two", PAGE)
+    (tmp_path / "_url_index.json").unlink()
+    monkeypatch.setattr(cache, "_url_index", None)
+
+    found = cache._find_cache_file_for_url("https://a.test/two")
+
+    assert found and cache._read_cache_metadata(found)["url"] == "https://a.test/two"
+    assert set(cache.read_json(tmp_path / "_url_index.json")) == {
+        "https://a.test/one",
+        "https://a.test/two",
+    }
+    assert cache._find_cache_file_for_url("https://a.test/none") is None
+
+
+def test_stale_index_entry_is_not_trusted(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    state = _state("Enterprise", "23")
+    cache._cache_page_data(state, "https://a.test/old", PAGE)
+    # The same domain-row file is re-cached for another URL; the entry for
+    # the old URL still names it but no longer matches
+    cache._save_url_index(
+        {
+            "https://a.test/old": "page_check_Enterprise-23.json",
+            "https://a.test/new": "page_check_Enterprise-23.json",
+        }
+    )
+    cache._cache_page_data(state, "https://a.test/new", PAGE)
+
+    assert cache._find_cache_file_for_url("https://a.test/old") is None
+    assert cache.read_json(tmp_path / "_url_index.json") == {
+        "https://a.test/new": "page_check_Enterprise-23.json"
+    }
+
+
+def test_index_edits_by_another_process_are_picked_up(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    cache._save_url_index({"https://a.test/p": "page_check_a.json"})
+    assert cache._load_url_index() == {"https://a.test/p": "page_check_a.json"}
+
+    index_file = tmp_path / "_url_index.json"
+    cache.write_json(index_file, {"https://a.test/p": "page_check_b.json"})
+    mtime_ns = index_file.stat().st_mtime_ns + 10**9
+    os.utime(index_file, ns=(mtime_ns, mtime_ns))
+
+    assert cache._load_url_index() == {"https://a.test/p": "page_check_b.json"}
+
+
+def test_unchanged_page_data_leaves_the_file_alone(monkeypatch, tmp_path, capsys):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    state = _state("Enterprise", "23")
+    cache_file = tmp_path / "page_check_Enterprise-23.json"
+
+    cache._cache_page_data(state, "https://a.test/p", PAGE)
+    first = cache_file.read_bytes()
+    cache._cache_page_data(state, "https://a.test/p", dict(PAGE))
+
+    assert cache_file.read_bytes() == first
+    assert "unchanged" in capsys.readouterr().out.splitlines()[-1]
+
+    cache._cache_page_data(state, "https://a.test/p", {**PAGE, "meta_robots": "x"})
+
+    metadata, page_data = cache._load_cached_page_data(cache_file)
+    assert page_data["meta_robots"] == "x"
+    assert metadata["payload_hash"] != json.loads(first)["metadata"]["payload_hash"]
+
+
+def test_metadata_is_read_from_the_head_or_the_whole_file(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    cache._cache_page_data(_state(), "https://a.test/p", PAGE)
+    (cache_file,) = tmp_path.glob("page_check_*.json")
+    full = cache._load_cached_page_data(cache_file)[0]
+
+    assert cache._read_cache_metadata(cache_file) == full
+    # Metadata cut off by the head read falls back to parsing the whole file
+    monkeypatch.setattr(cache, "_METADATA_HEAD_BYTES", 40)
+    assert cache._read_cache_metadata(cache_file) == full
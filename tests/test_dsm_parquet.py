@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data.dsm as dsm
+
+
+def _workbook(path, rows):
+    pd.DataFrame(rows, columns=["URL", "Proposed"]).to_excel(
+        path, sheet_name="Sheet1", index=False
+    )
+
+
+def test_without_pyarrow_the_workbook_is_used_directly(monkeypatch, tmp_path):
+    monkeypatch.setattr(dsm, "DSM_PARQUET_CACHE_DIR", tmp_path / "dsm")
+    monkeypatch.setattr(dsm.importlib.util, "find_spec", lambda name: None)
+    xlsx = tmp_path / "dsm-0101.xlsx"
+    _workbook(xlsx, [["https://a.test/p", "/new/p"]])
+
+    excel = dsm.load_spreadsheet(str(xlsx))
+
+    assert isinstance(excel, pd.ExcelFile)
+    assert not (tmp_path / "dsm").exists()
+
+
+def test_sheet_parquet_cannot_hold_is_returned_uncached(tmp_path):
+    xlsx = tmp_path / "dsm-0101.xlsx"
+    _workbook(xlsx, [["https://a.test/p", 1], ["https://a.test/q", "mixed"]])
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    df = dsm.ParquetCachedExcelFile(str(xlsx), cache_dir).parse("Sheet1")
+
+    assert list(df["URL"]) == ["https://a.test/p", "https://a.test/q"]
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_parsed_sheets_are_reused_until_the_workbook_changes(monkeypatch, tmp_path):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(dsm, "DSM_PARQUET_CACHE_DIR", tmp_path / "dsm")
+    xlsx = tmp_path / "dsm-0101.xlsx"
+    _workbook(xlsx, [["https://a.test/p", "/new/p"]])
+
+    first = dsm.load_spreadsheet(str(xlsx)).parse("Sheet1", header=0)
+
+    # Same file again: answered from parquet without opening the workbook
+    reopened = dsm.load_spreadsheet(str(xlsx))
+    excel_file = pd.ExcelFile
+    monkeypatch.setattr(dsm.pd, "ExcelFile", None)
+    pd.testing.assert_frame_equal(reopened.parse("Sheet1", header=0), first)
+    monkeypatch.setattr(dsm.pd, "ExcelFile", excel_file)
+
+    mtime_ns = os.stat(xlsx).st_mtime_ns
+    _workbook(xlsx, [["https://a.test/p", "/newer/p"]])
+    os.utime(xlsx, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    changed = dsm.load_spreadsheet(str(xlsx)).parse("Sheet1", header=0)
+
+    assert list(changed["Proposed"]) == ["/newer/p"]
+    assert [p.name for p in (tmp_path / "dsm").iterdir()] == [
+        dsm._parquet_cache_dir(str(xlsx)).name
+    ]
+
+
+def test_parquet_caches_of_older_workbooks_are_removed(monkeypatch, tmp_path):
+    monkeypatch.setattr(dsm, "DSM_PARQUET_CACHE_DIR", tmp_path / "dsm")
+    xlsx = tmp_path / "dsm-0101.xlsx"
+    _workbook(xlsx, [["https://a.test/p", "/new/p"]])
+    keep = dsm._parquet_cache_dir(str(xlsx))
+    for name in [keep.name, "dsm-0101-1-2", "dsm-0202-1-2", "dsm-0101-notes"]:
+        (tmp_path / "dsm" / name).mkdir(parents=True)
+
+    dsm._remove_stale_parquet_caches(str(xlsx), keep)
+
+    remaining = sorted(p.name for p in (tmp_path / "dsm").iterdir())
+    assert remaining == sorted([keep.name, "dsm-0202-1-2", "dsm-0101-notes"])
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+import commands.scan as scan
+from state import CLIState
+
+PAGE = "https://a.test/people"
+IMGS = (
+    '<img alt="John Smith" src="/smith-1.jpg">'
+    '<img alt="Dr. Smith" src="/smith-2.jpg">'
+    '<img alt="Ann Lee" src="/lee.jpg">'
+)
+
+
+def _setup(monkeypatch, tmp_path, answers, download):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        scan,
+        "_fetch_headshot_pages",
+        lambda state, urls: [(PAGE, (BeautifulSoup(IMGS, "html.parser"), PAGE))],
+    )
+    monkeypatch.setattr(scan, "_download_headshot", download)
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return answers.pop(0)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    state = CLIState()
+    state.set_variable("EXISTING_URLS", [PAGE])
+    return state, prompts
+
+
+def _write_part(src, headshots_dir, filename_stem):
+    path = headshots_dir / f"{filename_stem}.jpg"
+    scan._part_path(path).write_text(src)
+    return path
+
+
+def test_failed_download_falls_back_to_next_candidate(monkeypatch, tmp_path):
+    def download(src, headshots_dir, filename_stem):
+        if src.endswith("smith-1.jpg"):
+            raise OSError("connection reset")
+        return _write_part(src, headshots_dir, filename_stem)
+
+    state, prompts = _setup(monkeypatch, tmp_path, ["y", "y"], download)
+    target = {"first": "John", "last": "Smith", "pct_keys": ["smith-john"]}
+
+    scan._download_headshots_for_targets(state, [target])
+
+    saved = tmp_path / "headshots" / "smith-john_SC.jpg"
+    assert saved.read_text() == "https://a.test/smith-2.jpg"
+    assert len(prompts) == 2
+
+
+def test_declined_overwrite_falls_back_to_next_candidate(monkeypatch, tmp_path):
+    state, prompts = _setup(monkeypatch, tmp_path, ["y", "n", "y", "y"], _write_part)
+    (tmp_path / "headshots").mkdir()
+    existing = tmp_path / "headshots" / "smith-john_SC.jpg"
+    existing.write_text("old")
+
+    scan._download_headshots_for_targets(
+        state, [{"first": "John", "last": "Smith", "pct_keys": ["smith-john"]}]
+    )
+
+    assert existing.read_text() == "https://a.test/smith-2.jpg"
+    assert [p.startswith("Save") for p in prompts] == [True, False, True, False]
+
+
+def test_picks_sharing_a_stem_never_download_together(monkeypatch, tmp_path):
+    active = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def download(src, headshots_dir, filename_stem):
+        with lock:
+            if filename_stem in active:
+                overlaps.append(filename_stem)
+            active.add(filename_stem)
+        time.sleep(0.05)
+        try:
+            return _write_part(src, headshots_dir, filename_stem)
+        finally:
+            with lock:
+                active.discard(filename_stem)
+
+    # Both targets resolve to the same stem; the second save must overwrite
+    state, prompts = _setup(monkeypatch, tmp_path, ["y", "y", "y"], download)
+    targets = [
+        {"first": "John", "last": "Smith", "pct_keys": ["smith"]},
+        {"first": "Jane", "last": "Smith", "pct_keys": ["smith"]},
+    ]
+
+    scan._download_headshots_for_targets(state, targets)
+
+    assert overlaps == []
+    assert "Overwrite" in prompts[-1]
+    assert not list((tmp_path / "headshots").glob("*.part"))
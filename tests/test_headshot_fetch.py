@@ -0,0 +1,67 @@
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+import commands.scan as scan
+
+PAGE = b'<html><body><img src="/a.jpg"></body></html>'
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        # Like a WAF that rejects HEAD but serves GET
+        self.send_response(403)
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        pdf = self.path.endswith(".pdf")
+        body = b"%PDF-1.4" if pdf else PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf" if pdf else "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    # The local server must be reached directly, not through a SOCKS proxy
+    monkeypatch.setattr(scan.session, "proxies", {})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_page_is_fetched_even_when_head_is_rejected(base_url):
+    soup, final_url = scan._fetch_headshot_page(f"{base_url}/people")
+
+    assert final_url == f"{base_url}/people"
+    assert soup.find("img")["src"] == "/a.jpg"
+
+
+def test_non_html_is_skipped_and_errors_raise(base_url):
+    assert scan._fetch_headshot_page(f"{base_url}/file.pdf") is None
+    with pytest.raises(scan.requests.HTTPError):
+        scan._fetch_headshot_page(f"{base_url}/missing")
+
+
+def test_async_fetch_matches_threaded_fetch(base_url):
+    if scan.aiohttp is None:
+        pytest.skip("aiohttp is not installed")
+    urls = [f"{base_url}/people", f"{base_url}/file.pdf", f"{base_url}/missing"]
+
+    page, skipped, missing = asyncio.run(scan._fetch_headshot_pages_async(urls))
+
+    assert page[0].find("img")["src"] == "/a.jpg"
+    assert skipped is None
+    assert isinstance(missing, Exception)
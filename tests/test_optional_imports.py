@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# module -> (optional imports it must survive without, names left as None)
+OPTIONAL = {
+    "utils.cache": (["orjson", "ijson", "xxhash"], ["orjson", "ijson", "xxhash"]),
+    "utils.scraping": (
+        ["aiohttp", "selectolax", "selectolax.lexbor", "lxml"],
+        ["aiohttp", "LexborHTMLParser"],
+    ),
+    "commands.scan": (["aiohttp", "lxml"], ["aiohttp"]),
+}
+
+
+@pytest.mark.parametrize("module", sorted(OPTIONAL))
+def test_module_imports_without_optional_dependencies(module, tmp_path):
+    blocked, none_names = OPTIONAL[module]
+    script = (
+        "import sys\n"
+        f"for name in {blocked!r}:\n"
+        "    sys.modules[name] = None  # makes the import raise ImportError\n"
+        f"import {module} as m\n"
+        f"assert all(getattr(m, n) is None for n in {none_names!r})\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    # Modules create their cache directories on import, so run elsewhere
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_cache_json_helpers_work_without_orjson(monkeypatch, tmp_path):
+    import utils.cache as cache
+
+    monkeypatch.setattr(cache, "orjson", None)
+    cache.write_json(tmp_path / "x.json", {"name": "Müller", "rows": [1, 2]})
+
+    assert cache.read_json(tmp_path / "x.json") == {"name": "Müller", "rows": [1, 2]}
+
+
+def test_payload_hash_works_without_xxhash(monkeypatch):
+    import utils.cache as cache
+
+    monkeypatch.setattr(cache, "xxhash", None)
+
+    assert cache._payload_hash(b"a") == cache._payload_hash(b"a")
+    assert cache._payload_hash(b"a") != cache._payload_hash(b"b")
+
+
+def test_page_tree_falls_back_to_beautifulsoup(monkeypatch):
+    import utils.scraping as scraping
+
+    monkeypatch.setattr(scraping, "LexborHTMLParser", None)
+    response = scraping._PageResponse(
+        "https://a.test/", b'<div id="main"><a href="/x">x</a></div>', "text/html"
+    )
+    tree = scraping._parse_response(response)
+
+    assert not scraping._is_lexbor(tree)
+    assert scraping._collect_anchors(tree, "#main", response.url)[0] == [
+        ("x", "https://a.test/x")
+    ]
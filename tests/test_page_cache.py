@@ -0,0 +1,77 @@
+import pytest
+import requests
+
+import utils.scraping as scraping
+
+
+class _FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = self.body
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        return response
+
+
+def _use_tmp_cache(monkeypatch, tmp_path, body):
+    session = _FakeSession(body)
+    monkeypatch.setattr(scraping, "PAGE_HTML_CACHE_DIR", tmp_path / "html")
+    monkeypatch.setattr(scraping, "_PAGE_HTML_TTL", 3600)
+    monkeypatch.setattr(scraping, "_SESSION", session)
+    return session
+
+
+def test_cached_page_is_reused(monkeypatch, tmp_path):
+    session = _use_tmp_cache(monkeypatch, tmp_path, b"<p>v1</p>")
+
+    first = scraping._fetch_page("https://a.test/page")
+    session.body = b"<p>v2</p>"
+    second = scraping._fetch_page("https://a.test/page")
+
+    assert session.calls == 1
+    assert second.content == first.content == b"<p>v1</p>"
+    assert second.encoding == "utf-8"
+
+
+def test_force_refresh_refetches_and_updates_cache(monkeypatch, tmp_path):
+    session = _use_tmp_cache(monkeypatch, tmp_path, b"<p>v1</p>")
+
+    scraping._fetch_page("https://a.test/page")
+    session.body = b"<p>v2</p>"
+    refreshed = scraping._fetch_page("https://a.test/page", force_refresh=True)
+    cached = scraping._fetch_page("https://a.test/page")
+
+    assert session.calls == 2
+    assert refreshed.content == cached.content == b"<p>v2</p>"
+
+
+@pytest.mark.parametrize("meta", ['{"content_type": "text/html"}', "[]", "null"])
+def test_malformed_cache_meta_is_a_miss(monkeypatch, tmp_path, meta):
+    session = _use_tmp_cache(monkeypatch, tmp_path, b"<p>v1</p>")
+    scraping._fetch_page("https://a.test/page")
+    _, meta_file = scraping._page_cache_paths("https://a.test/page")
+    meta_file.write_text(meta, encoding="utf-8")
+
+    response = scraping._fetch_page("https://a.test/page")
+
+    assert session.calls == 2
+    assert response.content == b"<p>v1</p>"
+
+
+def test_retrieve_pages_passes_force_refresh(monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        scraping,
+        "retrieve_page_data",
+        lambda url, selector, sidebar, async_fetch, force: seen.append((url, force)),
+    )
+
+    scraping.retrieve_pages(["u1", "u2"], force_refresh=True)
+
+    assert seen == [("u1", True), ("u2", True)]
@@ -0,0 +1,51 @@
+import os
+
+from openpyxl import Workbook
+
+import commands.scan as scan
+
+
+def _workbook(path, values):
+    wb = Workbook()
+    for value in values:
+        wb.active.append([value])
+    wb.save(path)
+
+
+def test_index_is_cached_as_json_and_refreshed_on_change(monkeypatch, tmp_path):
+    monkeypatch.setattr(scan, "PCT_INDEX_CACHE_DIR", tmp_path / "pct")
+    xlsx = tmp_path / "pct-1.xlsx"
+    _workbook(xlsx, ["Smith-John-1234", "Doe-Jane"])
+
+    first = scan._load_column_a_index(str(xlsx))
+    (cached,) = (tmp_path / "pct").iterdir()
+    assert cached.suffix == ".json"
+
+    # A hit must not touch the workbook
+    read_workbook = scan._load_column_a_as_keys
+    monkeypatch.setattr(scan, "_load_column_a_as_keys", None)
+    assert scan._load_column_a_index(str(xlsx)) == first
+    monkeypatch.setattr(scan, "_load_column_a_as_keys", read_workbook)
+
+    # A changed workbook gets a new index, and the old one is removed
+    _workbook(xlsx, ["Smith-John-1234", "Doe-Jane", "Lee-Bob"])
+    os.utime(xlsx, ns=(0, os.stat(xlsx).st_mtime_ns + 10**9))
+    second = scan._load_column_a_index(str(xlsx))
+
+    assert set(second) - set(first)
+    assert [p.name for p in (tmp_path / "pct").iterdir()] == [
+        scan._pct_index_cache_path(str(xlsx)).name
+    ]
+
+
+def test_unreadable_index_falls_back_to_workbook(monkeypatch, tmp_path):
+    monkeypatch.setattr(scan, "PCT_INDEX_CACHE_DIR", tmp_path / "pct")
+    xlsx = tmp_path / "pct-2.xlsx"
+    _workbook(xlsx, ["Smith-John-1234"])
+    cache_path = scan._pct_index_cache_path(str(xlsx))
+    cache_path.parent.mkdir()
+    cache_path.write_text("not json")
+
+    assert scan._load_column_a_index(str(xlsx)) == scan._load_column_a_as_keys(
+        str(xlsx)
+    )
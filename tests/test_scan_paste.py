@@ -0,0 +1,40 @@
+import commands.scan as scan
+
+
+def _parse(monkeypatch, lines):
+    received = []
+    monkeypatch.setattr(
+        scan, "_process_received_data", lambda data, state=None: received.extend(data)
+    )
+    scan._process_pasted_data(lines)
+    return received
+
+
+def test_leading_quote_does_not_swallow_later_records(monkeypatch, capsys):
+    people = _parse(
+        monkeypatch,
+        ['"Jack" John;Doe;true;;', "Jane;Smith;false;;", "Bob;Lee;true;h;p"],
+    )
+
+    assert [p["name"] for p in people] == [
+        ['"Jack" John', "Doe"],
+        ["Jane", "Smith"],
+        ["Bob", "Lee"],
+    ]
+    assert people[2]["headshotImgString"] == "h"
+    assert people[2]["pCardName"] == "p"
+    assert "too few fields" not in capsys.readouterr().out
+
+
+def test_literal_newline_separators(monkeypatch):
+    people = _parse(monkeypatch, ["A;B;true;;\\nD;E;false;;"])
+
+    assert [p["name"] for p in people] == [["A", "B"], ["D", "E"]]
+    assert [p["found"] for p in people] == [True, False]
+
+
+def test_short_record_reports_its_own_line(monkeypatch, capsys):
+    people = _parse(monkeypatch, ['"Jack;Doe;true;;', "Jane;Smith", "Bob;Lee;true;;"])
+
+    assert [p["name"] for p in people] == [['"Jack', "Doe"], ["Bob", "Lee"]]
+    assert "Line 2 has too few fields, skipping: Jane;Smith" in capsys.readouterr().out
@@ -0,0 +1,41 @@
+import utils.scraping as scraping
+
+
+def _use_tmp_cache(monkeypatch, tmp_path, answers):
+    calls = []
+
+    def fake_check(url, session=None):
+        calls.append(url)
+        return answers[url]
+
+    monkeypatch.setattr(scraping, "STATUS_CACHE_FILE", tmp_path / "status.json")
+    monkeypatch.setattr(scraping, "_status_cache", None)
+    monkeypatch.setattr(scraping, "check_status_code", fake_check)
+    return calls
+
+
+def test_only_working_links_are_reused(monkeypatch, tmp_path):
+    answers = {"https://a.test/ok": "200", "https://a.test/gone": "404"}
+    calls = _use_tmp_cache(monkeypatch, tmp_path, answers)
+
+    first = scraping._check_status_codes(list(answers))
+    answers["https://a.test/gone"] = "200"
+    second = scraping._check_status_codes(list(answers))
+
+    assert first == {"https://a.test/ok": "200", "https://a.test/gone": "404"}
+    assert second["https://a.test/gone"] == "200"
+    assert calls == list(answers) + ["https://a.test/gone"]
+
+
+def test_force_refresh_bypasses_cache(monkeypatch, tmp_path):
+    answers = {"https://a.test/page": "200"}
+    calls = _use_tmp_cache(monkeypatch, tmp_path, answers)
+
+    scraping._check_status_codes(list(answers))
+    answers["https://a.test/page"] = "500"
+    refreshed = scraping._check_status_codes(list(answers), force_refresh=True)
+
+    assert refreshed == {"https://a.test/page": "500"}
+    assert len(calls) == 2
+    # The broken answer replaces the cached one
+    assert "https://a.test/page" not in scraping.read_json(tmp_path / "status.json")
@@ -1,20 +1,103 @@
+import functools
+import hashlib
 import json
+import os
 import re
 from pathlib import Path
 from datetime import datetime
 
 from utils.core import debug_print, normalize_url
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json path below is equivalent
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; _read_cache_metadata falls back to a head read
+    ijson = None
+
+try:
+    import xxhash
+except ImportError:  # optional; _payload_hash falls back to hashlib
+    xxhash = None
+
 CACHE_DIR = Path("migration_cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
+# metadata is written first and is a few hundred bytes, so this much of a
+# cache file normally holds all of it
+_METADATA_HEAD_BYTES = 8192
+
+
+def _dumps_json(obj):
+    """Serialize ``obj`` as 2-space indented UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path, obj):
+    """Write ``obj`` as 2-space indented UTF-8 JSON (orjson when available)."""
+    with open(path, "wb") as f:
+        f.write(_dumps_json(obj))
+
+
+def _payload_hash(payload):
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def read_json(path):
+    """Load JSON written by ``write_json`` (orjson when available)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# normalized URL -> cache file name, so URL lookups don't have to open every
+# page_check_*.json; held in memory and reloaded when the file's mtime changes
+URL_INDEX_FILE = CACHE_DIR / "_url_index.json"
+_url_index = None
+_url_index_mtime = None
+
+
+def _load_url_index():
+    global _url_index, _url_index_mtime
+    try:
+        mtime = URL_INDEX_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _url_index, _url_index_mtime = {}, None
+        return _url_index
+    if _url_index is None or mtime != _url_index_mtime:
+        try:
+            _url_index = read_json(URL_INDEX_FILE)
+        except (OSError, json.JSONDecodeError) as e:
+            debug_print(f"Ignoring unreadable URL index {URL_INDEX_FILE}: {e}")
+            _url_index = {}
+        _url_index_mtime = mtime
+    return _url_index
+
+
+def _save_url_index(index):
+    global _url_index, _url_index_mtime
+    tmp_file = URL_INDEX_FILE.with_name(URL_INDEX_FILE.name + ".part")
+    try:
+        write_json(tmp_file, index)
+        os.replace(tmp_file, URL_INDEX_FILE)
+        _url_index, _url_index_mtime = index, URL_INDEX_FILE.stat().st_mtime_ns
+    except OSError as e:
+        debug_print(f"Error writing URL index {URL_INDEX_FILE}: {e}")
+
 
 def _cache_page_data(state, url, data):
-    domain = state.get_variable("DOMAIN")
-    row = state.get_variable("ROW")
-    kanban_id = state.get_variable("KANBAN_ID")
-    selector = state.get_variable("SELECTOR")
-    include_sidebar = state.get_variable("INCLUDE_SIDEBAR")
+    domain, row, kanban_id, selector, include_sidebar = state.get_variables(
+        "DOMAIN", "ROW", "KANBAN_ID", "SELECTOR", "INCLUDE_SIDEBAR"
+    )
     url = normalize_url(url)
 
     if domain and row:
@@ -25,25 +108,53 @@ def _cache_page_data(state, url, data):
 
     cache_file = CACHE_DIR / cache_filename
 
-    cache_data = {
-        "metadata": {
-            "url": url,
-            "domain": domain,
-            "row": row,
-            "kanban_id": kanban_id,
-            "selector": selector,
-            "include_sidebar": include_sidebar,
-            "timestamp": datetime.now().isoformat(),
-            "cache_filename": cache_filename,
-        },
-        "page_data": data,
+    metadata = {
+        "url": url,
+        "domain": domain,
+        "row": row,
+        "kanban_id": kanban_id,
+        "selector": selector,
+        "include_sidebar": include_sidebar,
+        "timestamp": datetime.now().isoformat(),
+        "cache_filename": cache_filename,
     }
+    cache_data = {"metadata": metadata, "page_data": data}
 
     try:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        # Hash everything but the timestamp; a re-check that found the same
+        # page leaves the file (and its mtime, which reports key off) alone
+        payload_hash = _payload_hash(
+            _dumps_json(
+                {
+                    "metadata": {k: v for k, v in metadata.items() if k != "timestamp"},
+                    "page_data": data,
+                }
+            )
+        )
+        unchanged = (
+            cache_file.exists()
+            and _read_cache_metadata(cache_file).get("payload_hash") == payload_hash
+        )
+        if not unchanged:
+            metadata["payload_hash"] = payload_hash
+            # Write beside the target and swap in, so an interrupted write
+            # never leaves a truncated cache file behind
+            tmp_file = cache_file.with_name(cache_file.name + ".part")
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps_json(cache_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
         state.set_variable("CACHE_FILE", str(cache_file))
-        print(f"✅ Data cached to {cache_file}")
+        index = _load_url_index()
+        if index.get(url) != cache_filename:
+            index = dict(index)
+            index[url] = cache_filename
+            _save_url_index(index)
+        if unchanged:
+            print(f"✅ Cached data unchanged in {cache_file}")
+        else:
+            print(f"✅ Data cached to {cache_file}")
         debug_print(f"Cache metadata: {cache_data['metadata']}")
     except Exception as e:
         debug_print(f"Error caching data to {cache_file}: {e}")
@@ -68,22 +179,38 @@ def _get_expected_metadata_structure():
     }
 
 
+_EXPECTED_METADATA_KEYS = frozenset(_get_expected_metadata_structure())
+
+
 def _is_metadata_structure_current(metadata):
     """Check if the metadata structure matches current expectations."""
     if not isinstance(metadata, dict):
         return False
 
-    expected_keys = set(_get_expected_metadata_structure().keys())
-    actual_keys = set(metadata.keys())
-
     # Check if all expected keys are present
-    return expected_keys.issubset(actual_keys)
+    return _EXPECTED_METADATA_KEYS.issubset(metadata.keys())
 
 
 def _load_cached_page_data(cache_file_path):
+    """Return (metadata, page_data) for a cache file.
+
+    Parsed files are memoized on (path, mtime, size): the check, load and
+    report flows read the same file several times per command, and a
+    rewrite by _cache_page_data changes the key. Callers treat the returned
+    dicts as read-only.
+    """
+    try:
+        stat = os.stat(cache_file_path)
+    except FileNotFoundError as e:
+        debug_print(f"Error loading cache file {cache_file_path}: {e}")
+        return {}, {}
+    return _parse_cache_file(str(cache_file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cache_file(cache_file_path, mtime_ns, size):
     try:
-        with open(cache_file_path, "r", encoding="utf-8") as f:
-            cached_content = json.load(f)
+        cached_content = read_json(cache_file_path)
 
         if (
             isinstance(cached_content, dict)
@@ -98,9 +225,67 @@ def _load_cached_page_data(cache_file_path):
         return {}, {}
 
 
+def _read_cache_metadata(cache_file_path):
+    """Return only the metadata of a cache file, without decoding page_data.
+
+    Falls back to a full _load_cached_page_data when the metadata can't be
+    read from the head of the file.
+    """
+    try:
+        if ijson is not None:
+            with open(cache_file_path, "rb") as f:
+                for metadata in ijson.items(f, "metadata"):
+                    if isinstance(metadata, dict):
+                        return metadata
+                    break
+        else:
+            with open(cache_file_path, "rb") as f:
+                head = f.read(_METADATA_HEAD_BYTES)
+            start = head.find(b'"metadata"')
+            colon = head.find(b":", start) if start != -1 else -1
+            if colon != -1:
+                # a multi-byte character cut at the end of the head is dropped
+                text = head[colon + 1 :].decode("utf-8", "ignore").lstrip()
+                metadata, _ = json.JSONDecoder().raw_decode(text)
+                if isinstance(metadata, dict):
+                    return metadata
+    except (OSError, ValueError) as e:
+        debug_print(f"Reading full cache file {cache_file_path}: {e}")
+    metadata, _ = _load_cached_page_data(cache_file_path)
+    return metadata
+
+
 def _is_cache_valid_for_context(state, cache_file):
+    """Return (is_valid, reason) for using cache_file in the current context.
+
+    The verdict is memoized on the file's (mtime, size) and the context
+    variables it depends on, so repeated checks within a session are free.
+    """
     if not cache_file:
         return False, "No cache file specified"
+    try:
+        stat = os.stat(cache_file)
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    except OSError:
+        mtime_ns = size = None
+    return _validate_cache_context(
+        str(cache_file),
+        mtime_ns,
+        size,
+        *state.get_variables("URL", "DOMAIN", "ROW", "INCLUDE_SIDEBAR"),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_cache_context(
+    cache_file,
+    mtime_ns,
+    size,
+    current_url,
+    current_domain,
+    current_row,
+    current_include_sidebar,
+):
     try:
         metadata, page_data = _load_cached_page_data(cache_file)
         if not metadata:
@@ -118,11 +303,6 @@ def _is_cache_valid_for_context(state, cache_file):
         ):
             return False, "Cache missing meta description or robots data"
 
-        current_url = state.get_variable("URL")
-        current_domain = state.get_variable("DOMAIN")
-        current_row = state.get_variable("ROW")
-        current_include_sidebar = state.get_variable("INCLUDE_SIDEBAR")
-
         cached_url = metadata.get("url")
         cached_domain = metadata.get("domain")
         cached_row = metadata.get("row")
@@ -175,18 +355,40 @@ def _find_cache_file_for_url(url):
     if not url:
         return None
     url = normalize_url(url)
+
+    # The index can go stale (a domain-row file re-cached for another URL, a
+    # file deleted by hand), so a hit is confirmed against the file itself
+    indexed_name = _load_url_index().get(url)
+    if indexed_name:
+        cache_file = CACHE_DIR / indexed_name
+        metadata = _read_cache_metadata(cache_file)
+        cached_url = metadata.get("url")
+        if cached_url and normalize_url(cached_url) == url:
+            debug_print(f"Found cache file for URL {url} via index: {cache_file}")
+            return str(cache_file)
+
+    # Index miss: scan every cache file, rebuilding the index on the way
+    found = None
+    index = {}
     for cache_file in CACHE_DIR.glob("page_check_*.json"):
         try:
-            metadata, _ = _load_cached_page_data(cache_file)
+            metadata = _read_cache_metadata(cache_file)
             cached_url = metadata.get("url")
-            if cached_url and normalize_url(cached_url) == url:
+            if not cached_url:
+                continue
+            cached_url = normalize_url(cached_url)
+            index.setdefault(cached_url, cache_file.name)
+            if found is None and cached_url == url:
                 debug_print(f"Found cache file for URL {url}: {cache_file}")
-                return str(cache_file)
+                found = str(cache_file)
         except Exception as e:
             debug_print(f"Error checking cache file {cache_file}: {e}")
             continue
-    debug_print(f"No cache file found for URL: {url}")
-    return None
+    if index != _load_url_index():
+        _save_url_index(index)
+    if found is None:
+        debug_print(f"No cache file found for URL: {url}")
+    return found
 
 
 def _update_state_from_cache(state, url=None, domain=None, row=None):
@@ -2,7 +2,11 @@
 Utility functions for People Card CLI.
 """
 
+import functools
+import io
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 import socket
 
@@ -15,6 +19,33 @@ from utils.sitecore import format_hierarchy
 
 DEBUG = False
 
+# Shared by check_status_code so repeat hosts reuse keep-alive connections
+# instead of paying a TCP+TLS handshake per link
+_status_session = requests.Session()
+_status_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_status_session.mount("http://", _status_adapter)
+_status_session.mount("https://", _status_adapter)
+
+# Hostnames counted as internal when analyzing a page's links
+_INTERNAL_DOMAINS = frozenset(DOMAIN_MAPPING)
+
+
+def _hostname(href):
+    """Return the lowercased hostname of href, like urlparse(href).hostname."""
+    # plain http(s) links are sliced directly; anything unusual (no scheme,
+    # userinfo, IPv6 literals) goes through urlparse
+    if href.startswith(("https://", "http://")):
+        start = href.index("//") + 2
+        end = len(href)
+        for sep in "/?#":
+            i = href.find(sep, start)
+            if i != -1 and i < end:
+                end = i
+        netloc = href[start:end]
+        if "@" not in netloc and "[" not in netloc:
+            return netloc.split(":", 1)[0].lower() or None
+    return urlparse(href).hostname
+
 
 def sync_debug_with_state(state):
     """Sync the cached DEBUG value with the state."""
@@ -22,6 +53,11 @@ def sync_debug_with_state(state):
     DEBUG = state.get_variable("DEBUG")
 
 
+def debug_enabled():
+    """Return the current DEBUG flag, for guarding costly debug messages."""
+    return DEBUG
+
+
 def debug_print(*msg):
     """Print debug messages if DEBUG is enabled."""
     if DEBUG and len(msg) == 1:
@@ -41,13 +77,24 @@ def set_debug(enabled, state):
         debug_print(f"Debugging is {'enabled' if enabled else 'disabled'}")
 
 
-def check_status_code(url):
+# Statuses meaning the server won't answer HEAD; check_status_code retries with GET
+_HEAD_NOT_ALLOWED = (405, 501)
+
+
+def check_status_code(url, session=None):
     # if the URL is has URI, skip
     if not urlparse(url).scheme:
         debug_print(f"Skipping status check for URL without scheme: {url}")
         return "0"
     try:
-        response = requests.head(url, allow_redirects=True, timeout=3)
+        session = session or _status_session
+        response = session.head(url, allow_redirects=True, timeout=3)
+        if response.status_code in _HEAD_NOT_ALLOWED:
+            # Server refuses HEAD; a streamed GET reads only the headers
+            with session.get(
+                url, allow_redirects=True, timeout=3, stream=True
+            ) as response:
+                pass
         debug_print(f"Checked URL: {url} - Status Code: {response.status_code}")
         return str(response.status_code)
     except (requests.Timeout, requests.exceptions.ReadTimeout, socket.timeout) as e:
@@ -59,6 +106,9 @@ def check_status_code(url):
 
 
 def normalize_url(url):
+    # nearly every URL already carries a lowercase http(s) scheme
+    if url.startswith(("https://", "http://")):
+        return url
     parsed = urlparse(url)
     if not parsed.scheme:
         return "http://" + url
@@ -94,14 +144,9 @@ def output_internal_links_analysis_detail(state):
     print("=" * 50)
 
     # Filter out internal links based on known domains
-    internal_domains = set(DOMAIN_MAPPING.keys())
-
-    internal_links = []
-
-    for text, href, status in links + pdfs:
-        parsed = urlparse(href)
-        if parsed.hostname in internal_domains:
-            internal_links.append((text, href, status))
+    internal_links = [
+        link for link in links + pdfs if _hostname(link[1]) in _INTERNAL_DOMAINS
+    ]
 
     if not internal_links:
         print("✅ No internal links found.")
@@ -110,12 +155,17 @@ def output_internal_links_analysis_detail(state):
     print(f"Found {len(internal_links)} internal links:")
     print()
 
+    # Navigation and sidebar often repeat the same href; look each up once
+    lookups = {}
+
     for i, (text, href, status) in enumerate(internal_links, 1):
         print(f"{i:2}. {text[:60]}")
         print(f"    🔗 {href}")
 
         # Perform automatic lookup
-        result = lookup_link_in_dsm(href, state.excel_data, state)
+        result = lookups.get(href)
+        if result is None:
+            result = lookups[href] = lookup_link_in_dsm(href, state.excel_data, state)
         if result["found"]:
             print(f"    ✅ Found in DSM - {result['domain']} - {result['row']}")
             # use shared formatting for new path
@@ -136,88 +186,95 @@ def output_internal_links_analysis_detail(state):
     )
 
 
+def _status_icon(status):
+    return "✅" if status[:1] == "2" else "❌" if status != "0" else "⚠️"
+
+
 def display_page_data(data):
-    print("\n" + "=" * 60)
-    print("EXTRACTED PAGE DATA")
-    print("=" * 60)
+    # Lines are collected in memory and written to stdout once at the end
+    out = io.StringIO()
+    emit = functools.partial(print, file=out)
+    try:
+        _emit_page_data(data, emit)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+def _emit_page_data(data, emit):
+    emit("\n" + "=" * 60)
+    emit("EXTRACTED PAGE DATA")
+    emit("=" * 60)
     if "error" in data:
-        print(f"❌ Error occurred: {data['error']}")
+        emit(f"❌ Error occurred: {data['error']}")
         return
-    print(f"📄 Source URL: {data.get('url', 'Unknown')}")
-    print(f"🎯 CSS Selector: {data.get('selector_used', 'Unknown')}")
+    emit(f"📄 Source URL: {data.get('url', 'Unknown')}")
+    emit(f"🎯 CSS Selector: {data.get('selector_used', 'Unknown')}")
     if data.get("include_sidebar", False):
-        print("🔲 Sidebar inclusion: ENABLED")
-    print()
+        emit("🔲 Sidebar inclusion: ENABLED")
+    emit()
 
     # Display main content
     links = data.get("links", [])
-    print(f"🔗 LINKS FOUND: {len(links)}")
+    emit(f"🔗 LINKS FOUND: {len(links)}")
     if links:
-        print("-" * 40)
+        emit("-" * 40)
         for i, (text, href, status) in enumerate(links, 1):
-            status_icon = (
-                "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
-            )
-            print(f"{i:2}. {status_icon} [{status}] {text[:50]}")
-            print(f"    → {href}")
+            status_icon = _status_icon(status)
+            emit(f"{i:2}. {status_icon} [{status}] {text[:50]}")
+            emit(f"    → {href}")
 
     # Display sidebar links if they exist (with subtle distinction)
     sidebar_links = data.get("sidebar_links", [])
     if sidebar_links:
-        print()
-        print(f"🔗 SIDEBAR LINKS: {len(sidebar_links)}")
-        print("-" * 40)
+        emit()
+        emit(f"🔗 SIDEBAR LINKS: {len(sidebar_links)}")
+        emit("-" * 40)
         for i, (text, href, status) in enumerate(sidebar_links, len(links) + 1):
-            status_icon = (
-                "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
-            )
+            status_icon = _status_icon(status)
             # Add subtle indicator with │ character
-            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
-            print(f"   │→ {href}")
+            emit(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
+            emit(f"   │→ {href}")
 
-    print()
+    emit()
     pdfs = data.get("pdfs", [])
-    print(f"📄 PDF FILES: {len(pdfs)}")
+    emit(f"📄 PDF FILES: {len(pdfs)}")
     if pdfs:
-        print("-" * 40)
+        emit("-" * 40)
         for i, (text, href, status) in enumerate(pdfs, 1):
-            status_icon = (
-                "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
-            )
-            print(f"{i:2}. {status_icon} [{status}] {text[:50]}")
-            print(f"    → {href}")
+            status_icon = _status_icon(status)
+            emit(f"{i:2}. {status_icon} [{status}] {text[:50]}")
+            emit(f"    → {href}")
 
     # Display sidebar PDFs if they exist
     sidebar_pdfs = data.get("sidebar_pdfs", [])
     if sidebar_pdfs:
-        print()
-        print(f"📄 SIDEBAR PDF FILES: {len(sidebar_pdfs)}")
-        print("-" * 40)
+        emit()
+        emit(f"📄 SIDEBAR PDF FILES: {len(sidebar_pdfs)}")
+        emit("-" * 40)
         for i, (text, href, status) in enumerate(sidebar_pdfs, len(pdfs) + 1):
-            status_icon = (
-                "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
-            )
-            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
-            print(f"   │→ {href}")
+            status_icon = _status_icon(status)
+            emit(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
+            emit(f"   │→ {href}")
 
-    print()
+    emit()
     embeds = data.get("embeds", [])
-    print(f"🎬 VIMEO EMBEDS: {len(embeds)}")
+    emit(f"🎬 VIMEO EMBEDS: {len(embeds)}")
     if embeds:
-        print("-" * 40)
+        emit("-" * 40)
         for i, (title, src) in enumerate(embeds, 1):
-            print(f"{i:2}. [VIMEO] {title[:50]}")
-            print(f"    → {src}")
+            emit(f"{i:2}. [VIMEO] {title[:50]}")
+            emit(f"    → {src}")
 
     # Display sidebar embeds if they exist
     sidebar_embeds = data.get("sidebar_embeds", [])
     if sidebar_embeds:
-        print()
-        print(f"🎬 SIDEBAR VIMEO EMBEDS: {len(sidebar_embeds)}")
-        print("-" * 40)
+        emit()
+        emit(f"🎬 SIDEBAR VIMEO EMBEDS: {len(sidebar_embeds)}")
+        emit("-" * 40)
         for i, (title, src) in enumerate(sidebar_embeds, len(embeds) + 1):
-            print(f"{i:2}.│[VIMEO] {title[:50]}")
-            print(f"   │→ {src}")
+            emit(f"{i:2}.│[VIMEO] {title[:50]}")
+            emit(f"   │→ {src}")
 
-    print()
-    print("=" * 60)
+    emit()
+    emit("=" * 60)
@@ -48,11 +48,7 @@ class CommandHistory:
             return
 
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:  # Skip empty lines
-                        readline.add_history(line)
+            readline.read_history_file(str(self.history_file))
         except (IOError, OSError) as e:
             # Silently ignore errors - history is nice-to-have
             pass
@@ -63,17 +59,9 @@ class CommandHistory:
             # Create directory if it doesn't exist
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Get history from readline
-            history_length = readline.get_current_history_length()
-
-            # Determine how many items to save (respect max_history)
-            start_idx = max(0, history_length - self.max_history)
-
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                for i in range(start_idx + 1, history_length + 1):
-                    item = readline.get_history_item(i)
-                    if item:
-                        f.write(f"{item}\n")
+            # readline truncates the written file to the last max_history items
+            readline.set_history_length(self.max_history)
+            readline.write_history_file(str(self.history_file))
         except (IOError, OSError) as e:
             # Silently ignore errors - history is nice-to-have
             pass
@@ -1,26 +1,50 @@
+import functools
 import os
 import re
 from typing import List, Optional, Tuple
 
 from utils.core import debug_print
 
+_CLEAN_RE = re.compile(r"""[^"\w\s\-\.' ]""")
+_POSTNOMINAL_RE = re.compile(
+    r"\b(Jr\.?|Sr\.?|II|III|IV|V|M\.?D\.?|Ph\.?D\.?|Esq\.?|B\.?A\.?|B\.?S\.?|M\.?H\.?A\.?|M\.?A\.?|M\.?S\.?|M\.?B\.?A\.?|J\.?D\.?|Ed\.?D\.?|Psy\.?D\.?|D\.?D\.?S\.?|D\.?V\.?M\.?|R\.?N\.?|C\.?P\.?A\.?|D\.Phil|P\.?E\.?)\.?\s*$",
+    # flags=re.IGNORECASE,
+)
+# Last non-space character of anything _POSTNOMINAL_RE can match; names ending
+# in anything else can skip the substitution
+_POSTNOMINAL_LAST_CHARS = frozenset(".rIVDqASMNEl")
+_WS_RE = re.compile(r"\s+")
+_QUOTED_RE = re.compile(r'"(.*?)"')
+_INITIAL_RE = re.compile(r"^[A-Za-z]\.?$")
+# Dot-free spellings _POSTNOMINAL_RE strips from a plain letters-and-spaces name
+_BARE_POSTNOMINALS = frozenset(
+    "Jr Sr II III IV V MD PhD Esq BA BS MHA MA MS MBA JD EdD PsyD DDS DVM RN CPA PE".split()
+)
+# Per-function bound for the memoized name helpers below; report rows keep
+# feeding new names for the whole session
+_NAME_CACHE_SIZE = 4096
+
 
 def load_extracted_people_names(path: str) -> List[str]:
     """Load names from an extracted people list file, ignoring comments."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"{path} not found.")
 
-    names: List[str] = []
+    # One read, then split in memory; text mode has already folded \r\n and
+    # \r into \n, so this yields the same lines as iterating the file
     with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            # Skip empty lines and comments
-            if not raw or raw.startswith("#"):
-                continue
-            # Split on comma and take first part (in case there are credentials)
-            name_only = get_name_before_comma(raw)
-            if name_only:
-                names.append(name_only)
+        lines = f.read().split("\n")
+
+    names: List[str] = []
+    for line in lines:
+        raw = line.strip()
+        # Skip empty lines and comments
+        if not raw or raw.startswith("#"):
+            continue
+        # Split on comma and take first part (in case there are credentials)
+        name_only = get_name_before_comma(raw)
+        if name_only:
+            names.append(name_only)
 
     return names
 
@@ -31,27 +55,32 @@ def get_name_before_comma(name: str) -> str:
     return name.split(",", 1)[0].strip()
 
 
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def tokenize_name(name: str) -> Tuple[str, Optional[str], str]:
 
-    quote_replaced_name = name.replace("“", '"').replace("”", '"')
-    cleaned = re.sub(r"""[^"\w\s\-\.' ]""", " ", quote_replaced_name)
-    cleaned = re.sub(
-        r"\b(Jr\.?|Sr\.?|II|III|IV|V|M\.?D\.?|Ph\.?D\.?|Esq\.?|B\.?A\.?|B\.?S\.?|M\.?H\.?A\.?|M\.?A\.?|M\.?S\.?|M\.?B\.?A\.?|J\.?D\.?|Ed\.?D\.?|Psy\.?D\.?|D\.?D\.?S\.?|D\.?V\.?M\.?|R\.?N\.?|C\.?P\.?A\.?|D\.Phil|P\.?E\.?)\.?\s*$",
-        "",
-        cleaned,
-        # flags=re.IGNORECASE,
-    )
-    parts = [p for p in re.split(r"\s+", cleaned.strip()) if p]
+    parts = None
+    # Plain ASCII letters and spaces: the cleaning regexes would be no-ops
+    # unless the last word is a post-nominal, so split directly
+    if name.isascii() and name.replace(" ", "").isalpha():
+        parts = name.split()
+        if parts[-1] in _BARE_POSTNOMINALS:
+            parts = None
+    if parts is None:
+        quote_replaced_name = name.replace("“", '"').replace("”", '"')
+        cleaned = _CLEAN_RE.sub(" ", quote_replaced_name)
+        if cleaned.rstrip()[-1:] in _POSTNOMINAL_LAST_CHARS:
+            cleaned = _POSTNOMINAL_RE.sub("", cleaned)
+        parts = [p for p in _WS_RE.split(cleaned.strip()) if p]
     if len(parts) < 2:
         return (parts[0], None, "") if parts else ("", None, "")
 
     for p in parts:
         if '"' in p:
-            match = re.search(r'"(.*?)"', p)
+            match = _QUOTED_RE.search(p)
             if match:
                 first = match.group(1)
                 break
-        if re.match(r"^[A-Za-z]\.?$", parts[0]):
+        if _INITIAL_RE.match(parts[0]):
             first = parts[1] if len(parts) > 1 else parts[0]
             break
     else:
@@ -69,7 +98,14 @@ def tokenize_name(name: str) -> Tuple[str, Optional[str], str]:
     return first, mid_initial, last
 
 
-def key_variants_from_name(name: str) -> List[str]:
+def _norm_key_part(s: str) -> str:
+    # split()/join strips and collapses whitespace in one C pass; same
+    # whitespace set as \s+
+    return " ".join(s.replace(".", "").lower().split())
+
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
+def key_variants_from_name(name: str) -> Tuple[str, ...]:
     """
     Generate key variants from a person's name for matching purposes.
 
@@ -78,27 +114,31 @@ def key_variants_from_name(name: str) -> List[str]:
     then constructs unique key variants in the format 'last-first' and optionally
     'last-middle_initial-first' if a middle name is present.
 
+    Results are memoized: cmd_person re-derives the variants of every report
+    row for each searched name, so the same strings come through repeatedly.
+
     Args:
       name (str): The full name string to process.
 
     Returns:
-      List[str]: A list of unique normalized key variants derived from the name.
+      Tuple[str, ...]: The unique normalized key variants derived from the name.
     """
-    first, mid, last = tokenize_name(name)
+    return key_variants_from_tokens(*tokenize_name(name))
 
-    def norm(s: str) -> str:
-        s = s.replace(".", "")
-        s = re.sub(r"\s+", " ", s.strip().lower())
-        return s
 
-    first_n = norm(first)
-    last_n = norm(last)
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
+def key_variants_from_tokens(
+    first: str, mid: Optional[str], last: str
+) -> Tuple[str, ...]:
+    """Build the key variants from an already tokenized (first, mid, last) tuple."""
+    first_n = _norm_key_part(first)
+    last_n = _norm_key_part(last)
 
     variants = []
     if last_n and first_n:
         variants.append(f"{last_n}-{first_n}")
     if mid:
-        mid_n = norm(mid)[0] if norm(mid) else ""
+        mid_n = _norm_key_part(mid)[:1]
         if mid_n:
             variants.append(f"{last_n}-{mid_n}-{first_n}")
 
@@ -108,4 +148,4 @@ def key_variants_from_name(name: str) -> List[str]:
         if v not in seen:
             uniq.append(v)
             seen.add(v)
-    return uniq
+    return tuple(uniq)
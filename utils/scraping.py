@@ -2,45 +2,357 @@
 Page extraction and analysis utilities for People Card CLI.
 """
 
+import asyncio
+import hashlib
+import os
+import threading
+import time
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, UnicodeDammit
+from urllib.parse import urljoin, urlparse
 from pathlib import Path
 
-from utils.core import debug_print, normalize_url, check_status_code
+from utils.cache import read_json, write_json
+from utils.core import (
+    debug_enabled,
+    debug_print,
+    normalize_url,
+    check_status_code,
+    _status_session,
+    _HEAD_NOT_ALLOWED,
+)
+
+try:
+    import lxml  # noqa: F401
+
+    _PAGE_PARSER = "lxml"
+except ImportError:
+    _PAGE_PARSER = "html.parser"
+
+try:
+    import aiohttp
+except ImportError:  # optional; only used when ASYNC_FETCH is on
+    aiohttp = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional; extraction falls back to BeautifulSoup
+    LexborHTMLParser = None
 
 CACHE_DIR = Path("migration_cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
+# Link status checks are network-bound HEAD requests; run this many at once
+_STATUS_CHECK_WORKERS = 16
+# aiohttp connection caps for the same checks under ASYNC_FETCH
+_STATUS_ASYNC_LIMIT = 32
+_STATUS_ASYNC_PER_HOST = 16
+
+# Raw HTML of fetched pages, keyed by a hash of the URL, so re-running check
+# on the same pages skips the network; PEOPLE_CARD_PAGE_TTL (seconds, 0 to
+# disable) sets how long a copy stays fresh
+PAGE_HTML_CACHE_DIR = CACHE_DIR / "html"
+_PAGE_HTML_TTL = int(os.environ.get("PEOPLE_CARD_PAGE_TTL", "3600"))
+
+# url -> [status, checked_at]; links recur across pages and runs, so
+# working links (2xx/3xx) are reused for a day. Broken links, timeouts and
+# errors are always re-checked so a fix shows up on the next run
+STATUS_CACHE_FILE = CACHE_DIR / "_status_cache.json"
+_STATUS_CACHE_TTL = 24 * 60 * 60
+_status_cache = None
+# retrieve_page_data_many extracts several pages at once on worker threads
+_status_cache_lock = threading.Lock()
+
+# Page fetches share one keep-alive pool; connection failures are retried
+# with a short backoff (HTTP error statuses are not)
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "Mozilla/5.0 (compatible; people-card-cli)"
+_page_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_SESSION.mount("http://", _page_adapter)
+_SESSION.mount("https://", _page_adapter)
+
+
+def close_session():
+    """Close the pooled HTTP sessions used for page fetches and status checks."""
+    _SESSION.close()
+    _status_session.close()
+
+
+class _PageResponse:
+    """The parts of a requests.Response the extractors use.
+
+    Stands in for pages read from the HTML cache or fetched with aiohttp.
+    """
+
+    status_code = 200
+
+    def __init__(self, url, content, content_type):
+        self.url = url
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(
+            {"Content-Type": content_type}
+        )
+        self.encoding = requests.utils.get_encoding_from_headers(self.headers)
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", "replace")
+
+
+def _page_cache_paths(url):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return PAGE_HTML_CACHE_DIR / f"{key}.html", PAGE_HTML_CACHE_DIR / f"{key}.json"
+
+
+def _read_cached_page(url):
+    html_file, meta_file = _page_cache_paths(url)
+    try:
+        if time.time() - html_file.stat().st_mtime >= _PAGE_HTML_TTL:
+            return None
+        meta = read_json(meta_file)
+        cached_url, content_type = meta["url"], meta.get("content_type", "")
+        content = html_file.read_bytes()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    debug_print(f"Using cached HTML for {url}: {html_file}")
+    return _PageResponse(cached_url, content, content_type)
+
+
+def _write_cached_page(url, response):
+    html_file, meta_file = _page_cache_paths(url)
+    tmp_file = html_file.with_name(html_file.name + ".part")
+    try:
+        PAGE_HTML_CACHE_DIR.mkdir(exist_ok=True)
+        # The HTML file's mtime marks freshness, so it is replaced last
+        write_json(
+            meta_file,
+            {
+                "url": response.url,
+                "content_type": response.headers.get("Content-Type", ""),
+            },
+        )
+        tmp_file.write_bytes(response.content)
+        os.replace(tmp_file, html_file)
+    except OSError as e:
+        debug_print(f"Error caching HTML for {url}: {e}")
+
+
+def _fetch_page(url, force_refresh=False):
+    debug_print(f"Fetching page: {url}")
+    url = normalize_url(url)
+    debug_print(f"Normalized URL: {url}")
+    if _PAGE_HTML_TTL > 0 and not force_refresh:
+        cached = _read_cached_page(url)
+        if cached is not None:
+            return cached
+    try:
+        response = _SESSION.get(url, timeout=30)
+        debug_print(
+            f"HTTP GET request completed with status code: {response.status_code}"
+        )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        debug_print(f"Error fetching page: {e}")
+        raise
+    if _PAGE_HTML_TTL > 0:
+        _write_cached_page(url, response)
+    return response
+
 
-def get_page_soup(url):
+def _declared_encoding(response):
+    # Only trust requests' encoding when the server actually declared one;
+    # otherwise it falls back to ISO-8859-1 for any text/* response
+    content_type = response.headers.get("Content-Type", "").lower()
+    return response.encoding if "charset=" in content_type else None
+
+
+def get_page_soup(url, force_refresh=False):
     """
     Common utility to fetch a page and return the BeautifulSoup object.
 
     Args:
         url (str): The URL to fetch
+        force_refresh (bool): Fetch from the network even if a fresh copy of
+            the page is in the HTML cache
 
     Returns:
         tuple: (soup, response) - BeautifulSoup object and the response object
+        (a stand-in with url/content/headers when served from the cache)
 
     Raises:
         requests.RequestException: If there's an error fetching the page
     """
-    debug_print(f"Fetching page: {url}")
+    response = _fetch_page(url, force_refresh)
+    # Hand the parser raw bytes so encoding detection happens in C
+    soup = BeautifulSoup(
+        response.content, _PAGE_PARSER, from_encoding=_declared_encoding(response)
+    )
+    debug_print(f"HTML content successfully parsed with {_PAGE_PARSER}")
+    return soup, response
+
+
+def get_page_tree(url, force_refresh=False):
+    """Fetch a page and parse it for the extract_* helpers.
+
+    Returns ``(tree, response)`` where ``tree`` is a selectolax Lexbor
+    document when selectolax is installed and a BeautifulSoup object
+    otherwise; the extract_* functions accept either.
+    """
+    if LexborHTMLParser is None:
+        return get_page_soup(url, force_refresh)
+    response = _fetch_page(url, force_refresh)
+    return _parse_response(response), response
+
+
+def _parse_response(response):
+    """Parse a fetched page the way get_page_tree does."""
+    declared = _declared_encoding(response)
+    if LexborHTMLParser is None:
+        return BeautifulSoup(response.content, _PAGE_PARSER, from_encoding=declared)
+    # Lexbor reads bytes as UTF-8, so decode with the same detection
+    # BeautifulSoup would apply (declared charset, then <meta>, then guesses)
+    html = UnicodeDammit(
+        response.content, [declared] if declared else [], is_html=True
+    ).unicode_markup
+    tree = LexborHTMLParser(html or "")
+    debug_print("HTML content successfully parsed with selectolax")
+    return tree
+
+
+def _is_lexbor(tree):
+    return LexborHTMLParser is not None and not isinstance(tree, BeautifulSoup)
+
+
+def _select_container(tree, selector, warning):
+    """Return the element matching ``selector``, or the whole document."""
+    if _is_lexbor(tree):
+        container = tree.css_first(selector)
+    else:
+        container = tree.select_one(selector)
+    if not container:
+        print(warning)
+        container = tree
+    return container
+
+
+async def _check_status_codes_async(urls):
+    """aiohttp counterpart of check_status_code for a whole URL list."""
+    timeout = aiohttp.ClientTimeout(total=3)
+    connector = aiohttp.TCPConnector(
+        limit=_STATUS_ASYNC_LIMIT, limit_per_host=_STATUS_ASYNC_PER_HOST
+    )
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, trust_env=True
+    ) as client:
+
+        async def check(url):
+            if not urlparse(url).scheme:
+                debug_print(f"Skipping status check for URL without scheme: {url}")
+                return "0"
+            try:
+                async with client.head(url, allow_redirects=True) as response:
+                    status = response.status
+                if status in _HEAD_NOT_ALLOWED:
+                    async with client.get(url, allow_redirects=True) as response:
+                        status = response.status
+                debug_print(f"Checked URL: {url} - Status Code: {status}")
+                return str(status)
+            except asyncio.TimeoutError as e:
+                debug_print(f"⏳ Timeout checking URL {url}: {e}")
+                return "420"
+            except (aiohttp.ClientError, ValueError) as e:
+                debug_print(f"❌ Error checking URL {url}: {e}")
+                return "0"
+
+        return await asyncio.gather(*(check(url) for url in urls))
+
+
+def _load_status_cache():
+    global _status_cache
+    if _status_cache is None:
+        try:
+            _status_cache = read_json(STATUS_CACHE_FILE)
+        except FileNotFoundError:
+            _status_cache = {}
+        except (OSError, ValueError) as e:
+            debug_print(f"Ignoring unreadable status cache {STATUS_CACHE_FILE}: {e}")
+            _status_cache = {}
+    return _status_cache
+
+
+def _save_status_cache(cache):
+    now = time.time()
+    fresh = {
+        url: entry
+        for url, entry in cache.items()
+        if now - entry[1] < _STATUS_CACHE_TTL and _is_cacheable_status(entry[0])
+    }
+    tmp_file = STATUS_CACHE_FILE.with_name(STATUS_CACHE_FILE.name + ".part")
     try:
-        url = normalize_url(url)
-        debug_print(f"Normalized URL: {url}")
-        response = requests.get(url, timeout=30)
-        debug_print(
-            f"HTTP GET request completed with status code: {response.status_code}"
-        )
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        debug_print("HTML content successfully parsed with BeautifulSoup")
-        return soup, response
-    except requests.RequestException as e:
-        debug_print(f"Error fetching page: {e}")
-        raise
+        write_json(tmp_file, fresh)
+        os.replace(tmp_file, STATUS_CACHE_FILE)
+    except OSError as e:
+        debug_print(f"Error writing status cache {STATUS_CACHE_FILE}: {e}")
+
+
+def _is_cacheable_status(status):
+    return status[:1] in ("2", "3")
+
+
+def _check_status_codes(urls, async_fetch=False, force_refresh=False):
+    """Return {url: status_code} for ``urls``, checked concurrently.
+
+    Working links seen within the last day come from the status cache
+    (unless ``force_refresh``); only the rest hit the network.
+    """
+    now = time.time()
+    statuses = {}
+    pending = []
+    with _status_cache_lock:
+        cache = _load_status_cache()
+        for url in urls:
+            entry = None if force_refresh else cache.get(url)
+            if (
+                entry
+                and _is_cacheable_status(entry[0])
+                and now - entry[1] < _STATUS_CACHE_TTL
+            ):
+                statuses[url] = entry[0]
+            else:
+                pending.append(url)
+    debug_print(f"Status cache: {len(statuses)} hit(s), {len(pending)} to check")
+    if not pending:
+        return statuses
+
+    if async_fetch and aiohttp is not None:
+        results = asyncio.run(_check_status_codes_async(pending))
+    else:
+        if async_fetch:
+            debug_print(
+                "ASYNC_FETCH needs aiohttp; checking link statuses with threads"
+            )
+        workers = min(_STATUS_CHECK_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(check_status_code, pending))
+
+    now = time.time()
+    with _status_cache_lock:
+        for url, status in zip(pending, results):
+            statuses[url] = status
+            if _is_cacheable_status(status):
+                cache[url] = [status, now]
+            else:
+                cache.pop(url, None)
+        _save_status_cache(cache)
+    return statuses
 
 
 def extract_meta_description(soup):
@@ -53,6 +365,15 @@ def extract_meta_description(soup):
     Returns:
         str: The content of the meta description tag, or an empty string if not found
     """
+    if _is_lexbor(soup):
+        node = soup.css_first('meta[name="description"]')
+        if node is not None and "content" in node.attributes:
+            content = node.attributes["content"] or ""
+            debug_print(f"Meta description found: {content}")
+            return content
+        debug_print("No meta description found")
+        return ""
+
     meta_desc = soup.find("meta", attrs={"name": "description"})
     if meta_desc and "content" in meta_desc.attrs:
         debug_print(f"Meta description found: {meta_desc['content']}")
@@ -64,6 +385,16 @@ def extract_meta_description(soup):
 def extract_meta_robots(soup):
     """Extract the meta robots directive from a BeautifulSoup object."""
 
+    if _is_lexbor(soup):
+        # Lexbor evaluates the case-insensitive match natively
+        node = soup.css_first('meta[name="robots" i]')
+        if node is not None and "content" in node.attributes:
+            content = node.attributes["content"] or ""
+            debug_print(f"Meta robots found: {content}")
+            return content
+        debug_print("No meta robots tag found")
+        return ""
+
     meta_tag = soup.find("meta", attrs={"name": lambda x: x and x.lower() == "robots"})
     if meta_tag and "content" in meta_tag.attrs:
         debug_print(f"Meta robots found: {meta_tag['content']}")
@@ -72,7 +403,106 @@ def extract_meta_robots(soup):
     return ""
 
 
-def extract_links_from_page(soup, response, selector="#main"):
+def _resolve_href(base_url, href):
+    """urljoin(base_url, href), skipping the parse for plain absolute URLs."""
+    if href.startswith(("https://", "http://")):
+        host_start = href.index("//") + 2
+        # urljoin rewrites these forms (empty host, bare ?/#, stripped
+        # tabs/newlines, IPv6 validation), so they still go through it
+        if (
+            href[host_start : host_start + 1] not in ("", "/", "?", "#")
+            and "?#" not in href
+            and not href.endswith(("?", "#"))
+            and not any(c in href for c in "\t\n\r[")
+        ):
+            return href
+    return urljoin(base_url, href)
+
+
+def _collect_anchors(soup, selector, base_url=None):
+    """Walk the anchors under ``selector`` once, sorting links from embeds.
+
+    Returns ``(found, embeds)``: ``(text, href)`` pairs for hyperlinks, with
+    hrefs resolved against ``base_url`` (skipped when it is None), and
+    ``(title, src)`` pairs for Vimeo embeds (``<a href="#" data-video=...>``).
+    """
+    debug_print(f"Using CSS selector: {selector}")
+    container = _select_container(
+        soup,
+        selector,
+        f"⚠️ Warning ⚠️: No element found matching selector '{selector}', falling back to entire page",
+    )
+    if _is_lexbor(soup):
+        anchors = [(a.attributes, a.text(strip=True)) for a in container.css("a[href]")]
+    else:
+        anchors = [
+            (a.attrs, a.get_text(strip=True))
+            for a in container.find_all("a", href=True)
+        ]
+    debug_print(f"Found {len(anchors)} anchor tags")
+
+    # Per-anchor messages are only formatted when debugging is on
+    debug = debug_enabled()
+    found = []
+    embeds = []
+    for attrs, text in anchors:
+        raw_href = attrs["href"] or ""
+        if raw_href == "#" and "data-video" in attrs:
+            video_id = attrs["data-video"]
+            if video_id:
+                title = attrs.get("data-title", "") or text or "Vimeo Video"
+                embeds.append((title, f"https://player.vimeo.com/video/{video_id}"))
+                if debug:
+                    debug_print(f"Found Vimeo embed: {title}")
+            continue
+        if base_url is None:
+            continue
+
+        href = _resolve_href(base_url, raw_href)
+        if debug:
+            debug_print(
+                f"Processing link: {text[:50]}{'...' if len(text) > 50 else ''} -> {href}"
+            )
+        found.append((text, href))
+    return found, embeds
+
+
+def _categorize_links(found, async_fetch=False, statuses=None):
+    """Attach status codes to ``(text, href)`` pairs and split off PDFs.
+
+    ``statuses`` ({href: status}) may be supplied by a caller that already
+    checked these hrefs; otherwise they are checked here.
+    """
+    if statuses is None:
+        # Check each distinct href once, concurrently; results keep page order
+        unique_hrefs = list(dict.fromkeys(href for _, href in found))
+        statuses = _check_status_codes(unique_hrefs, async_fetch)
+
+    debug = debug_enabled()
+    links = []
+    pdfs = []
+    for text, href in found:
+        status_code = statuses[href]
+        # lowercase just the suffix rather than a copy of the whole URL
+        if href[-4:].lower() == ".pdf":
+            pdfs.append((text, href, status_code))
+            if debug:
+                debug_print("  -> Categorized as PDF")
+        else:
+            links.append((text, href, status_code))
+            if debug:
+                debug_print("  -> Categorized as regular link")
+    return links, pdfs
+
+
+def _extract_all(soup, response, selector="#main", async_fetch=False):
+    """Return ``(links, pdfs, embeds)`` for a page section in one anchor pass."""
+    found, embeds = _collect_anchors(soup, selector, response.url)
+    links, pdfs = _categorize_links(found, async_fetch)
+    return links, pdfs, embeds
+
+
+def extract_links_from_page(soup, response, selector="#main", async_fetch=False):
     """Return the hyperlinks found within a page section.
 
     Both the parsed ``soup`` and original ``response`` are required so that
@@ -84,41 +514,15 @@ def extract_links_from_page(soup, response, selector="#main"):
         response: ``requests`` response object used to resolve relative URLs.
         selector: CSS selector identifying the container to inspect. Defaults
             to ``"#main"`` and falls back to the entire page if not found.
+        async_fetch: Check link statuses with aiohttp instead of a thread
+            pool (when aiohttp is installed).
 
     Returns:
         tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
         Two lists containing ``(text, href, status_code)`` tuples for regular
         links and PDFs respectively.
     """
-
-    debug_print(f"Using CSS selector: {selector}")
-    container = soup.select_one(selector)
-    if not container:
-        print(
-            f"⚠️ Warning ⚠️: No element found matching selector '{selector}', falling back to entire page"
-        )
-        container = soup
-    anchors = container.find_all("a", href=True)
-    debug_print(f"Found {len(anchors)} anchor tags")
-    links = []
-    pdfs = []
-    for a in anchors:
-        if a.get("href") == "#" and a.has_attr("data-video"):
-            debug_print("Skipping anchor tag treated as Vimeo embed")
-            continue
-
-        text = a.get_text(strip=True)
-        href = urljoin(response.url, a["href"])
-        debug_print(
-            f"Processing link: {text[:50]}{'...' if len(text) > 50 else ''} -> {href}"
-        )
-        status_code = check_status_code(href)
-        if href.lower().endswith(".pdf"):
-            pdfs.append((text, href, status_code))
-            debug_print(f"  -> Categorized as PDF")
-        else:
-            links.append((text, href, status_code))
-            debug_print(f"  -> Categorized as regular link")
+    links, pdfs, _ = _extract_all(soup, response, selector, async_fetch)
     return links, pdfs
 
 
@@ -128,98 +532,202 @@ def extract_embeds_from_page(soup, selector="#main"):
     Embeds are represented in the markup as ``<a href="#" data-video="..." data-title="...">``
     elements, which are transformed into iframes by client-side JavaScript.
     """
-
-    embeds = []
-    container = soup.select_one(selector)
-    if not container:
-        print(
-            f"Warning: No element found matching selector '{selector}', falling back to entire page for embeds"
-        )
-        container = soup
-
-    for a in container.find_all("a", href="#"):
-        video_id = a.get("data-video")
-        if not video_id:
-            continue
-        title = a.get("data-title", "") or a.get_text(strip=True) or "Vimeo Video"
-        src = f"https://player.vimeo.com/video/{video_id}"
-        embeds.append((title, src))
-        debug_print(f"Found Vimeo embed: {title}")
-
+    _, embeds = _collect_anchors(soup, selector)
     return embeds
 
 
-def retrieve_page_data(url, selector="#main", include_sidebar=False):
+def retrieve_page_data(
+    url, selector="#main", include_sidebar=False, async_fetch=False, force_refresh=False
+):
     debug_print(f"Retrieving page data for URL: {url}")
 
     try:
-        soup, response = get_page_soup(url)
-
-        # Extract main content
-        debug_print(f"Extracting main content using selector: {selector}")
-        main_links, main_pdfs = extract_links_from_page(soup, response, selector)
+        soup, response = get_page_tree(url, force_refresh)
+        return _extract_page_data(
+            soup, response, selector, include_sidebar, async_fetch, force_refresh
+        )
+    except Exception as e:
+        debug_print(f"Error retrieving page data: {e}")
+        return _page_data_error(url, selector, include_sidebar, e)
+
+
+def _extract_page_data(
+    soup, response, selector, include_sidebar, async_fetch=False, force_refresh=False
+):
+    # Collect anchors for main content (and the sidebar, if requested)
+    # first so every status check for the page runs as one batch
+    debug_print(f"Extracting main content using selector: {selector}")
+    main_found, main_embeds = _collect_anchors(soup, selector, response.url)
+
+    sidebar_found = None
+    sidebar_links, sidebar_pdfs, sidebar_embeds = [], [], []
+    if include_sidebar:
+        debug_print("Sidebar content extraction enabled")
+        try:
+            sidebar_found, sidebar_embeds = _collect_anchors(
+                soup, "#sidebar-components", response.url
+            )
+        except Exception as e:
+            debug_print(f"Warning: Error extracting sidebar content: {e}")
+
+    unique_hrefs = list(
+        dict.fromkeys(href for _, href in main_found + (sidebar_found or []))
+    )
+    statuses = _check_status_codes(unique_hrefs, async_fetch, force_refresh)
+
+    main_links, main_pdfs = _categorize_links(main_found, statuses=statuses)
+    debug_print(
+        f"Extracted {len(main_links)} links and {len(main_pdfs)} PDFs from main content"
+    )
+    debug_print(f"Extracted {len(main_embeds)} embeds from main content")
+
+    if sidebar_found is not None:
+        sidebar_links, sidebar_pdfs = _categorize_links(
+            sidebar_found, statuses=statuses
+        )
         debug_print(
-            f"Extracted {len(main_links)} links and {len(main_pdfs)} PDFs from main content"
+            f"Extracted {len(sidebar_links)} links and {len(sidebar_pdfs)} PDFs from sidebar"
         )
-        main_embeds = extract_embeds_from_page(soup, selector)
-        debug_print(f"Extracted {len(main_embeds)} embeds from main content")
-
-        # Extract sidebar content if requested
-        sidebar_links, sidebar_pdfs, sidebar_embeds = [], [], []
-        if include_sidebar:
-            debug_print("Sidebar content extraction enabled")
-            try:
-                sidebar_links, sidebar_pdfs = extract_links_from_page(
-                    soup, response, "#sidebar-components"
-                )
-                debug_print(
-                    f"Extracted {len(sidebar_links)} links and {len(sidebar_pdfs)} PDFs from sidebar"
-                )
-                sidebar_embeds = extract_embeds_from_page(soup, "#sidebar-components")
-                debug_print(f"Extracted {len(sidebar_embeds)} embeds from sidebar")
-            except Exception as e:
-                debug_print(f"Warning: Error extracting sidebar content: {e}")
-
-        meta_description = extract_meta_description(soup)
-        debug_print(f"Meta description extracted: {meta_description}")
-        meta_robots = extract_meta_robots(soup)
-        debug_print(f"Meta robots extracted: {meta_robots}")
-
-        data = {
-            "links": main_links,
-            "pdfs": main_pdfs,
-            "embeds": main_embeds,
-            "sidebar_links": sidebar_links,
-            "sidebar_pdfs": sidebar_pdfs,
-            "sidebar_embeds": sidebar_embeds,
-            "meta_description": meta_description,
-            "meta_robots": meta_robots,
-        }
-
-        total_main = len(main_links) + len(main_pdfs) + len(main_embeds)
-        total_sidebar = len(sidebar_links) + len(sidebar_pdfs) + len(sidebar_embeds)
+        debug_print(f"Extracted {len(sidebar_embeds)} embeds from sidebar")
+
+    meta_description = extract_meta_description(soup)
+    debug_print(f"Meta description extracted: {meta_description}")
+    meta_robots = extract_meta_robots(soup)
+    debug_print(f"Meta robots extracted: {meta_robots}")
+
+    data = {
+        "links": main_links,
+        "pdfs": main_pdfs,
+        "embeds": main_embeds,
+        "sidebar_links": sidebar_links,
+        "sidebar_pdfs": sidebar_pdfs,
+        "sidebar_embeds": sidebar_embeds,
+        "meta_description": meta_description,
+        "meta_robots": meta_robots,
+    }
+
+    total_main = len(main_links) + len(main_pdfs) + len(main_embeds)
+    total_sidebar = len(sidebar_links) + len(sidebar_pdfs) + len(sidebar_embeds)
+    debug_print(
+        f"Extracted main content: {len(main_links)} links, {len(main_pdfs)} PDFs, {len(main_embeds)} embeds"
+    )
+    if include_sidebar:
         debug_print(
-            f"Extracted main content: {len(main_links)} links, {len(main_pdfs)} PDFs, {len(main_embeds)} embeds"
+            f"Extracted sidebar content: {len(sidebar_links)} links, {len(sidebar_pdfs)} PDFs, {len(sidebar_embeds)} embeds"
         )
-        if include_sidebar:
-            debug_print(
-                f"Extracted sidebar content: {len(sidebar_links)} links, {len(sidebar_pdfs)} PDFs, {len(sidebar_embeds)} embeds"
+
+    return data
+
+
+def _page_data_error(url, selector, include_sidebar, error):
+    return {
+        "url": url,
+        "links": [],
+        "pdfs": [],
+        "embeds": [],
+        "sidebar_links": [],
+        "sidebar_pdfs": [],
+        "sidebar_embeds": [],
+        "meta_description": "",
+        "meta_robots": "",
+        "error": str(error),
+        "selector_used": selector,
+        "include_sidebar": include_sidebar,
+    }
+
+
+async def retrieve_page_data_many(
+    urls,
+    selector="#main",
+    include_sidebar=False,
+    concurrency=16,
+    async_fetch=False,
+    force_refresh=False,
+):
+    """
+    retrieve_page_data for several URLs, fetching the pages concurrently.
+
+    Pages are downloaded over one aiohttp session (sharing the HTML cache
+    with _fetch_page); parsing and extraction run on the default executor
+    so one page's link checks don't hold up the others' downloads.
+
+    Returns:
+        dict: Page data keyed by the URLs as given, in input order
+    """
+    loop = asyncio.get_running_loop()
+    timeout = aiohttp.ClientTimeout(total=30)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={"User-Agent": _SESSION.headers["User-Agent"]},
+        trust_env=True,
+    ) as client:
+
+        async def fetch(url):
+            url = normalize_url(url)
+            if _PAGE_HTML_TTL > 0 and not force_refresh:
+                cached = _read_cached_page(url)
+                if cached is not None:
+                    return cached
+            async with client.get(url) as page:
+                debug_print(f"HTTP GET {url} completed with status code: {page.status}")
+                page.raise_for_status()
+                response = _PageResponse(
+                    str(page.url),
+                    await page.read(),
+                    page.headers.get("Content-Type", ""),
+                )
+            if _PAGE_HTML_TTL > 0:
+                _write_cached_page(url, response)
+            return response
+
+        def extract(response):
+            soup = _parse_response(response)
+            return _extract_page_data(
+                soup, response, selector, include_sidebar, async_fetch, force_refresh
             )
 
-        return data
-    except Exception as e:
-        debug_print(f"Error retrieving page data: {e}")
-        return {
-            "url": url,
-            "links": [],
-            "pdfs": [],
-            "embeds": [],
-            "sidebar_links": [],
-            "sidebar_pdfs": [],
-            "sidebar_embeds": [],
-            "meta_description": "",
-            "meta_robots": "",
-            "error": str(e),
-            "selector_used": selector,
-            "include_sidebar": include_sidebar,
-        }
+        async def retrieve(url):
+            debug_print(f"Retrieving page data for URL: {url}")
+            try:
+                response = await fetch(url)
+                return await loop.run_in_executor(None, extract, response)
+            except Exception as e:
+                debug_print(f"Error retrieving page data for {url}: {e}")
+                return _page_data_error(url, selector, include_sidebar, e)
+
+        results = await asyncio.gather(*(retrieve(url) for url in urls))
+    return dict(zip(urls, results))
+
+
+def retrieve_pages(
+    urls,
+    selector="#main",
+    include_sidebar=False,
+    async_fetch=False,
+    force_refresh=False,
+):
+    """
+    Page data for each URL, in order.
+
+    With ASYNC_FETCH (and aiohttp installed) several pages are fetched
+    concurrently via retrieve_page_data_many; otherwise one at a time.
+    ``force_refresh`` bypasses the page HTML and link status caches.
+    """
+    if async_fetch and aiohttp is not None and len(urls) > 1:
+        results = asyncio.run(
+            retrieve_page_data_many(
+                urls,
+                selector,
+                include_sidebar,
+                async_fetch=async_fetch,
+                force_refresh=force_refresh,
+            )
+        )
+        return [results[u] for u in urls]
+    return [
+        retrieve_page_data(u, selector, include_sidebar, async_fetch, force_refresh)
+        for u in urls
+    ]
@@ -1,24 +1,40 @@
+import functools
 from urllib.parse import urlparse
 
 from constants import DOMAIN_MAPPING, DOMAINS
 
+# (url, root_for_new_sitecore) for the domains that define a new root
+_DOMAINS_WITH_ROOT = tuple(
+    (domain.get("url"), domain["root_for_new_sitecore"])
+    for domain in DOMAINS
+    if domain.get("root_for_new_sitecore")
+)
+
 
 def format_hierarchy(root: str, segments: list) -> str:
     """Format the Sitecore hierarchy as a multi-line filesystem-style tree."""
     lines = [f"🏠 {root}"]
-    for idx, seg in enumerate(segments):
-        indent = "|   " * idx
-        lines.append(f"{indent}|-- {seg}")
+    indent = ""
+    for seg in segments:
+        lines.append(indent + "|-- " + seg)
+        indent += "|   "
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=256)
+def _split_url(existing_url: str) -> tuple:
+    """Return ``(root, path_segments)`` for a URL from a single parse."""
+    parsed = urlparse(existing_url)
+    hostname = parsed.hostname or ""
+    root = DOMAIN_MAPPING.get(hostname, hostname.split(".")[0])
+    return root, tuple(seg for seg in parsed.path.strip("/").split("/") if seg)
+
+
 def get_sitecore_root(existing_url: str) -> str:
     """
     Infer the Sitecore root folder name from the existing URL's hostname.
     """
-    parsed = urlparse(existing_url)
-    hostname = parsed.hostname or ""
-    return DOMAIN_MAPPING.get(hostname, hostname.split(".")[0])
+    return _split_url(existing_url)[0]
 
 
 def get_current_sitecore_root(existing_url: str) -> str:
@@ -28,21 +44,21 @@ def get_current_sitecore_root(existing_url: str) -> str:
     return get_sitecore_root(existing_url)
 
 
+@functools.lru_cache(maxsize=256)
 def get_proposed_sitecore_root(existing_url: str) -> str:
     """Determine the Sitecore root folder for the redesigned site.
 
     The function checks the domain of ``existing_url`` against entries in
     :data:`DOMAINS` and returns the ``root_for_new_sitecore`` value when
     defined. If no mapping exists the current root is returned instead.
+    Results are memoized per URL.
     """
+    # utils.core imports this module at load time, so this import stays
+    # local (it now only runs on cache misses)
     from utils.core import debug_print
 
     proposed_root = next(
-        (
-            domain["root_for_new_sitecore"]
-            for domain in DOMAINS
-            if domain.get("url") in existing_url and domain.get("root_for_new_sitecore")
-        ),
+        (root for url, root in _DOMAINS_WITH_ROOT if url in existing_url),
         None,
     )
 
@@ -54,9 +70,7 @@ def print_hierarchy(existing_url: str):
     """
     Print the Sitecore hierarchy for the given page's existing URL.
     """
-    root = get_sitecore_root(existing_url)
-    # split existing path
-    segments = [seg for seg in urlparse(existing_url).path.strip("/").split("/") if seg]
+    root, segments = _split_url(existing_url)
     print("\nExisting directory hierarchy:")
     print(format_hierarchy(root, segments))
 
@@ -66,7 +80,7 @@ def print_proposed_hierarchy(existing_url: str, proposed_path: str):
     Print the Sitecore hierarchy for a proposed URL path,
     using the department root inferred from existing URL.
     """
-    root = get_sitecore_root(existing_url)
+    root, _ = _split_url(existing_url)
     segments = [seg for seg in proposed_path.strip("/").split("/") if seg]
     print("\nProposed directory hierarchy:")
     print(format_hierarchy(root, segments))
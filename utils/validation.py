@@ -3,6 +3,23 @@ from functools import wraps
 from constants import DOMAINS
 
 
+def _build_domain_index():
+    """Map lowercased full names and aliases to their DOMAINS entry.
+
+    setdefault keeps the earliest entry for a key, so lookups pick the same
+    domain a first-match scan over DOMAINS would.
+    """
+    index = {}
+    for domain in DOMAINS:
+        index.setdefault(domain.get("full_name", "").lower(), domain)
+        for alias in domain.get("aliases", []):
+            index.setdefault(alias.lower(), domain)
+    return index
+
+
+_DOMAIN_BY_KEY = _build_domain_index()
+
+
 def validate_load_args(args):
     """Validate arguments for the 'load' command.
 
@@ -32,15 +49,7 @@ def validate_load_args(args):
     except (TypeError, ValueError):
         raise ValueError("Row number must be an integer") from None
 
-    domain = next(
-        (
-            d
-            for d in DOMAINS
-            if d.get("full_name", "").lower() == user_domain.lower()
-            or user_domain.lower() in [alias.lower() for alias in d.get("aliases", [])]
-        ),
-        None,
-    )
+    domain = _DOMAIN_BY_KEY.get(user_domain.lower())
     if not domain:
         raise ValueError(f"Domain '{user_domain}' not found.")
 
@@ -67,8 +76,6 @@ def validation_wrapper(func):
                 validated = validator(args)
             except ValueError as e:
                 print(f"❌ {e}")
-                from commands.common import print_help_for_command
-
                 return
         return func(args, state, *f_args, validated=validated, **f_kwargs)
 